@@ -0,0 +1,47 @@
+"""quantize sentiment_aggregates percentages
+
+Revision ID: 5b7e0d9a4c21
+Revises: c3340cae2470
+Create Date: 2026-10-15 09:12:40.118532
+
+Store pos_pct / neg_pct / neu_pct as SMALLINT basis points
+(fraction * 10000) instead of double precision floats.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e0d9a4c21"
+down_revision: Union[str, None] = "c3340cae2470"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PCT_COLUMNS = ("pos_pct", "neg_pct", "neu_pct")
+
+
+def upgrade() -> None:
+    for column in PCT_COLUMNS:
+        op.alter_column(
+            "sentiment_aggregates",
+            column,
+            existing_type=sa.Float(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using=f"round({column} * 10000)::smallint",
+        )
+
+
+def downgrade() -> None:
+    for column in PCT_COLUMNS:
+        op.alter_column(
+            "sentiment_aggregates",
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f"{column} / 10000.0",
+        )
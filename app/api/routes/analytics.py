@@ -77,7 +77,9 @@ async def sentiment_trend(
     trend = await aggregates.compute_and_store_trend(
         db, video_uuid, user.org_id, window
     )
-    return {"trend": trend}
+    await db.commit()
+    # Stored as basis points; serve fractions
+    return {"trend": [aggregates.to_fractions(point) for point in trend]}
 
 
 @router.get(
@@ -100,7 +102,8 @@ async def sentiment_distribution(
         }
     """
     video_uuid = await _resolve_video_uuid(db, user.org_id, video_id)
-    return await aggregates.compute_distribution(db, video_uuid, user.org_id)
+    distribution = await aggregates.compute_distribution(db, video_uuid, user.org_id)
+    return aggregates.to_fractions(distribution)
 
 
 @router.get(
@@ -125,4 +128,5 @@ async def get_keywords(
     keywords_list = await keywords.compute_and_store_keywords(
         db, video_uuid, user.org_id, top_k
     )
+    await db.commit()
     return {"keywords": keywords_list}
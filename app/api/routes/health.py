@@ -18,7 +18,9 @@ Related modules:
     - app/services/nlp_sentiment.py → model warmup integration.
 """
 
+import asyncio
 import time
+
 import redis
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
@@ -58,7 +60,7 @@ async def readyz():
     """
     Readiness probe.
 
-    Performs:
+    Performs (concurrently):
         - DB check with a simple SELECT 1 query.
         - Redis ping to confirm cache/broker availability.
         - Celery ping to confirm worker responsiveness.
@@ -78,61 +80,58 @@ async def readyz():
             }
         }
     """
-    checks = {}
-    overall_status = "ok"
+    # Run the checks concurrently; blocking client calls go to threads
+    db, redis_check, celery, hf_model = await asyncio.gather(
+        _check_db(), _check_redis(), _check_celery(), _check_hf_model()
+    )
+    checks = {"db": db, "redis": redis_check, "celery": celery, "hf_model": hf_model}
+    overall_status = (
+        "degraded" if any(c["status"] == "error" for c in checks.values()) else "ok"
+    )
+
+    return {"status": overall_status, "checks": checks}
+
 
-    # Database check
+async def _check_db() -> dict:
+    """DB check with a simple SELECT 1 query."""
     start = time.time()
     try:
         async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
-        checks["db"] = {
-            "status": "ok",
-            "latency_ms": round((time.time() - start) * 1000, 2),
-        }
     except SQLAlchemyError:
-        checks["db"] = {"status": "error"}
-        overall_status = "degraded"
+        return {"status": "error"}
+    return {"status": "ok", "latency_ms": round((time.time() - start) * 1000, 2)}
+
 
-    # Redis check
+async def _check_redis() -> dict:
+    """Redis ping to confirm cache/broker availability."""
     start = time.time()
     try:
         r = redis.Redis.from_url(settings.REDIS_URL)
-        r.ping()
-        checks["redis"] = {
-            "status": "ok",
-            "latency_ms": round((time.time() - start) * 1000, 2),
-        }
+        await asyncio.to_thread(r.ping)
     except Exception:
-        checks["redis"] = {"status": "error"}
-        overall_status = "degraded"
+        return {"status": "error"}
+    return {"status": "ok", "latency_ms": round((time.time() - start) * 1000, 2)}
 
-    # Celery check
+
+async def _check_celery() -> dict:
+    """Celery ping to confirm worker responsiveness."""
     start = time.time()
     try:
-        task = ping.delay()
-        result = task.get(timeout=5)
-        if result == "pong":
-            checks["celery"] = {
-                "status": "ok",
-                "latency_ms": round((time.time() - start) * 1000, 2),
-            }
-        else:
-            checks["celery"] = {"status": "error"}
-            overall_status = "degraded"
+        result = await asyncio.to_thread(lambda: ping.delay().get(timeout=5))
     except Exception:
-        checks["celery"] = {"status": "error"}
-        overall_status = "degraded"
+        return {"status": "error"}
+    if result != "pong":
+        return {"status": "error"}
+    return {"status": "ok", "latency_ms": round((time.time() - start) * 1000, 2)}
 
-    # HuggingFace model flag check
+
+async def _check_hf_model() -> dict:
+    """HuggingFace model warmup flag check via Redis."""
     try:
         r = redis.Redis.from_url(settings.REDIS_URL)
-        if r.get("hf_model_loaded") == b"true":
-            checks["hf_model"] = {"status": "ok", "loaded": True}
-        else:
-            checks["hf_model"] = {"status": "not_loaded", "loaded": False}
+        if await asyncio.to_thread(r.get, "hf_model_loaded") == b"true":
+            return {"status": "ok", "loaded": True}
+        return {"status": "not_loaded", "loaded": False}
     except Exception:
-        checks["hf_model"] = {"status": "error", "loaded": False}
-        overall_status = "degraded"
-
-    return {"status": overall_status, "checks": checks}
+        return {"status": "error", "loaded": False}
@@ -9,10 +9,10 @@ Key responsibilities:
     - Keep secrets and configuration out of source code.
 
 Related modules:
-    - app/db/session.py → consumes DATABASE_URL for DB engine.
+    - app/db/session.py → consumes DATABASE_URL and pool sizing for DB engine.
     - app/tasks/celery_app.py → consumes Celery broker/result URLs.
     - app/services/nlp_sentiment.py → consumes HF_MODEL_NAME for model loading.
-    - app/core/security.py → consumes JWT_SECRET_KEY and JWT_ALGORITHM.
+    - app/core/security.py → consumes JWT_SECRET_KEY, JWT_ALGORITHM and BCRYPT_COST.
 """
 
 from pydantic_settings import BaseSettings
@@ -24,25 +24,35 @@ class Settings(BaseSettings):
 
     Attributes:
         PROJECT_NAME (str): Display name for the project.
+        ENV (str): Deployment environment ("dev", "prod", or "test").
         DATABASE_URL (str): Connection string for PostgreSQL.
+        DB_POOL_SIZE (int): Persistent connections kept by the DB engine pool.
+        DB_MAX_OVERFLOW (int): Extra connections allowed beyond DB_POOL_SIZE.
         REDIS_URL (str): Redis connection string (used for broker & cache).
         CELERY_BROKER_URL (str): Celery broker URL.
         CELERY_RESULT_BACKEND (str): Celery results backend.
         HF_MODEL_NAME (str): HuggingFace model identifier.
+        USE_ONNX_INT8 (bool): Serve the model as int8-quantized ONNX
+            (requires the optional `optimum[onnxruntime]` package).
+        ONNX_MODEL_DIR (str): Cache directory for exported ONNX models.
         SECRET_KEY (str): General secret key (deprecated in favor of JWT_SECRET_KEY).
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Default JWT expiration in minutes.
 
         JWT_SECRET_KEY (str): JWT signing key.
         JWT_ALGORITHM (str): Algorithm used for JWT (default HS256).
         JWT_EXP_MINUTES (int): Token expiration time in minutes.
+        BCRYPT_COST (int): bcrypt work factor (log2 rounds) for new hashes.
 
         YOUTUBE_API_KEY (str): API key for YouTube Data API.
     """
 
     PROJECT_NAME: str = "YouTube Sentiment Analyzer"
+    ENV: str = "dev"
 
     # Core env vars
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
     REDIS_URL: str
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
@@ -50,11 +60,18 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Sentiment model runtime
+    USE_ONNX_INT8: bool = False
+    ONNX_MODEL_DIR: str = "/tmp/ytsa-onnx"
+
     # JWT
     JWT_SECRET_KEY: str = "supersecret"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXP_MINUTES: int = 60
 
+    # Password hashing
+    BCRYPT_COST: int = 12
+
     # YouTube
     YOUTUBE_API_KEY: str
 
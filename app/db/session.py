@@ -24,6 +24,8 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     future=True,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     echo=True,
 )
 
@@ -26,8 +26,8 @@ Schema:
 
 import uuid
 
-from sqlalchemy import (Column, DateTime, Float, ForeignKey, Integer, String,
-                        UniqueConstraint)
+from sqlalchemy import (Column, DateTime, ForeignKey, Integer, SmallInteger,
+                        String, UniqueConstraint)
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -43,9 +43,9 @@ class SentimentAggregate(Base):
         video_id (str): Foreign key → videos.id, links aggregates to a video.
         window_start (datetime): Beginning of the time window (inclusive).
         window_end (datetime): End of the time window (exclusive).
-        pos_pct (float): Percentage of positive comments in the window.
-        neg_pct (float): Percentage of negative comments in the window.
-        neu_pct (float): Percentage of neutral comments in the window.
+        pos_pct (int): Share of positive comments, in basis points (0-10000).
+        neg_pct (int): Share of negative comments, in basis points (0-10000).
+        neu_pct (int): Share of neutral comments, in basis points (0-10000).
         count (int): Total number of comments analyzed in the window.
         created_at (datetime): Row creation timestamp.
     """
@@ -59,9 +59,9 @@ class SentimentAggregate(Base):
     )
     window_start = Column(DateTime(timezone=True), nullable=False)
     window_end = Column(DateTime(timezone=True), nullable=False)
-    pos_pct = Column(Float, nullable=False)
-    neg_pct = Column(Float, nullable=False)
-    neu_pct = Column(Float, nullable=False)
+    pos_pct = Column(SmallInteger, nullable=False)
+    neg_pct = Column(SmallInteger, nullable=False)
+    neu_pct = Column(SmallInteger, nullable=False)
     count = Column(Integer, nullable=False)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -9,7 +9,10 @@ Key responsibilities:
     - Query comment_sentiment records for a given video/org.
     - Group by time window (e.g., daily).
     - Compute percentages of pos/neg/neu labels.
-    - Persist results into sentiment_aggregates with uniqueness constraints.
+    - Persist results into sentiment_aggregates with uniqueness constraints
+      (writes are not committed here; callers own the transaction).
+    - Store percentages as basis points (fraction × 10000, SMALLINT) and
+      convert them back to fractions for API responses.
 
 Related modules:
     - app/models/comment_sentiment.py → source data.
@@ -27,6 +30,28 @@ from app.models.comment import Comment
 from app.models.comment_sentiment import CommentSentiment
 from app.models.sentiment_aggregate import SentimentAggregate
 
+# Percentages are quantized to basis points: 1.0 == 10000
+PCT_SCALE = 10000
+PCT_FIELDS = ("pos_pct", "neg_pct", "neu_pct")
+
+
+def to_basis_points(fraction) -> int:
+    """Quantize a fraction in [0, 1] to integer basis points."""
+    return int(round(float(fraction) * PCT_SCALE))
+
+
+def to_fractions(row: dict) -> dict:
+    """
+    Convert the basis-point percentages of an aggregate row back to fractions.
+
+    Args:
+        row (dict): Trend bucket or distribution dict with *_pct ints.
+
+    Returns:
+        dict: Copy of `row` with pos/neg/neu_pct as floats in [0, 1].
+    """
+    return {**row, **{field: row[field] / PCT_SCALE for field in PCT_FIELDS}}
+
 
 async def compute_and_store_trend(
     session: AsyncSession, video_id: str, org_id: str, window: str = "day"
@@ -44,9 +69,9 @@ async def compute_and_store_trend(
         list[dict]: One entry per time bucket with:
             - window_start: datetime
             - window_end: datetime
-            - pos_pct: float
-            - neg_pct: float
-            - neu_pct: float
+            - pos_pct: int (basis points)
+            - neg_pct: int (basis points)
+            - neu_pct: int (basis points)
             - count: int
     """
     stmt = (
@@ -79,9 +104,9 @@ async def compute_and_store_trend(
             video_id=video_id,
             window_start=window_start,
             window_end=window_end,
-            pos_pct=float(r["pos_pct"]),
-            neg_pct=float(r["neg_pct"]),
-            neu_pct=float(r["neu_pct"]),
+            pos_pct=to_basis_points(r["pos_pct"]),
+            neg_pct=to_basis_points(r["neg_pct"]),
+            neu_pct=to_basis_points(r["neu_pct"]),
             count=int(r["count"]),
         )
 
@@ -96,7 +121,6 @@ async def compute_and_store_trend(
         await session.execute(insert_stmt)
         aggregates.append(values)
 
-    await session.commit()
     return aggregates
 
 
@@ -113,9 +137,9 @@ async def compute_distribution(
 
     Returns:
         dict: {
-            "pos_pct": float,
-            "neg_pct": float,
-            "neu_pct": float,
+            "pos_pct": int,  # basis points
+            "neg_pct": int,  # basis points
+            "neu_pct": int,  # basis points
             "count": int
         }
     """
@@ -131,11 +155,12 @@ async def compute_distribution(
     result = await session.execute(stmt)
     rows = result.mappings().all()
 
-    total = sum(r["count"] for r in rows) or 1
+    counts = {r["label"]: r["count"] for r in rows}
+    total = sum(counts.values()) or 1
 
     return {
-        "pos_pct": next((r["count"] / total for r in rows if r["label"] == "pos"), 0.0),
-        "neg_pct": next((r["count"] / total for r in rows if r["label"] == "neg"), 0.0),
-        "neu_pct": next((r["count"] / total for r in rows if r["label"] == "neu"), 0.0),
+        "pos_pct": to_basis_points(counts.get("pos", 0) / total),
+        "neg_pct": to_basis_points(counts.get("neg", 0) / total),
+        "neu_pct": to_basis_points(counts.get("neu", 0) / total),
         "count": total,
     }
@@ -13,13 +13,26 @@ Related modules:
     - app/tasks/fetch.py → calls upsert_comments during ingestion pipeline.
 """
 
+from datetime import datetime
+
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.comment import Comment
 
+# Defaults for fields the YouTube API may omit (published_at is a naive
+# UTC DateTime column, so the fallback is a datetime, not a string)
+_COMMENT_DEFAULTS = {
+    "author": "Anonymous",
+    "published_at": datetime(1970, 1, 1),
+    "like_count": 0,
+    "parent_id": None,
+}
+
 
-async def upsert_comments(db: AsyncSession, org_id: str, video_id: str, comments: list[dict]):
+async def upsert_comments(
+    db: AsyncSession, org_id: str, video_id: str, comments: list[dict]
+):
     """
     Insert or update a batch of YouTube comments for a given org and video.
 
@@ -41,25 +54,27 @@ async def upsert_comments(db: AsyncSession, org_id: str, video_id: str, comments
         - Uses Postgres `INSERT ... ON CONFLICT (org_id, yt_comment_id) DO UPDATE`.
         - Conflict target matches the unique constraint defined in Comment.
         - Updates author, text, published_at, like_count, parent_id if duplicates exist.
-        - Commits changes at the end of execution.
+        - Each comment is mapped onto a fixed set of columns: omitted fields
+          get defaults and unknown keys are ignored, so every executemany
+          parameter set has the same keys (no per-row SQL expansion).
+        - Does not commit: the caller owns the transaction.
     """
-    # Normalize payload → always set org_id and video_id from args
-    values = []
-    for c in comments:
-        values.append(
-            {
-                "org_id": org_id,
-                "video_id": video_id,
-                "yt_comment_id": c["yt_comment_id"],
-                "author": c.get("author"),
-                "text": c.get("text"),
-                "published_at": c.get("published_at"),
-                "like_count": c.get("like_count", 0),
-                "parent_id": c.get("parent_id"),
-            }
-        )
+    if not comments:
+        return
+
+    # org_id and video_id always come from the args, never the payload
+    rows = [
+        {
+            "org_id": org_id,
+            "video_id": video_id,
+            "yt_comment_id": c["yt_comment_id"],
+            "text": c.get("text"),
+            **{field: c.get(field, d) for field, d in _COMMENT_DEFAULTS.items()},
+        }
+        for c in comments
+    ]
 
-    stmt = insert(Comment).values(values)
+    stmt = insert(Comment)
 
     excluded = stmt.excluded
 
@@ -74,5 +89,4 @@ async def upsert_comments(db: AsyncSession, org_id: str, video_id: str, comments
         },
     )
 
-    await db.execute(stmt)
-    await db.commit()
+    await db.execute(stmt, rows)
@@ -6,10 +6,11 @@ This service extracts and persists keyword frequencies
 from comments associated with a video.
 
 Key responsibilities:
-    - Tokenize all comments for a given org/video.
-    - Count term frequencies and select top_k terms.
+    - Tokenize, count, and rank terms inside PostgreSQL (regexp_matches +
+      GROUP BY, English stopwords removed) so only top_k rows leave the DB.
     - Upsert keyword stats into the `keywords` table.
     - Enforce uniqueness per (org_id, video_id, term).
+    - Leave commit to the caller (task or request owns the transaction).
 
 Related modules:
     - app/models/comment.py → source comment text.
@@ -18,20 +19,56 @@ Related modules:
 """
 
 import uuid
-from collections import Counter
-from datetime import datetime
+from datetime import datetime, timezone
 
-import nltk
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Text, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.comment import Comment
 from app.models.keyword import Keyword
 
-# Ensure tokenizers is available
-nltk.download("punkt", quiet=True)
-nltk.download("punkt_tab", quiet=True)
+# Lowercase word tokens of 3+ chars starting with a letter (apostrophes
+# kept, e.g. "don't")
+_TOKEN_PATTERN = "[a-z][a-z']{2,}"
+
+# Common English function words that never make useful keywords
+_STOPWORDS = frozenset(
+    """
+    about after again all also am an and any are as at be because been
+    before being but by can could did do does doing don't for from had has
+    have having he her here hers him his how i'm if in into is it it's its
+    just me more most my no not now of on once only or other our out over
+    own really same she so some such than that that's the their them then
+    there these they this those through to too up very was we were what when
+    where which while who why will with would you your
+    """.split()
+)
+
+
+def _top_terms_stmt():
+    """Build the (org_id, video_id, top_k)-parameterized top-terms query."""
+    # regexp_matches(..., 'g') yields one text[] per match; [1] is the token
+    token = func.regexp_matches(
+        func.lower(Comment.text), _TOKEN_PATTERN, "g", type_=ARRAY(Text)
+    )[1]
+    tokens = (
+        select(token.label("term"))
+        .where(Comment.org_id == bindparam("org_id"))
+        .where(Comment.video_id == bindparam("video_id"))
+        .subquery()
+    )
+    count = func.count().label("count")
+    return (
+        select(tokens.c.term, count)
+        .where(tokens.c.term.not_in(sorted(_STOPWORDS)))
+        .group_by(tokens.c.term)
+        .order_by(count.desc(), tokens.c.term)
+        .limit(bindparam("top_k"))
+    )
+
+
+_TOP_TERMS_STMT = _top_terms_stmt()
 
 
 async def compute_and_store_keywords(
@@ -49,45 +86,36 @@ async def compute_and_store_keywords(
     Returns:
         list[dict]: [{"term": str, "count": int}, ...]
     """
-    stmt = (
-        select(Comment.text)
-        .where(Comment.org_id == org_id)
-        .where(Comment.video_id == video_id)
+    # Aggregate in SQL: only the top_k (term, count) rows come back
+    result = await session.execute(
+        _TOP_TERMS_STMT, {"org_id": org_id, "video_id": video_id, "top_k": top_k}
     )
-    result = await session.execute(stmt)
-    texts = [r[0] for r in result.fetchall()]
-
-    # Tokenize + normalize
-    tokens = [w.lower() for text in texts for w in nltk.word_tokenize(text)]
-    if not tokens:
+    freq = result.all()
+    if not freq:
         return []
-    freq = Counter(tokens).most_common(top_k)
 
-    # Upsert into DB
-    upserted = []
-    for term, count in freq:
-        values = dict(
+    # Upsert into DB: one executemany statement, single timestamp per refresh
+    now = datetime.now(timezone.utc)
+    rows = [
+        dict(
             id=str(uuid.uuid4()),
             org_id=org_id,
             video_id=video_id,
             term=term,
             count=count,
-            last_updated_at=datetime.utcnow(),
-        )
-        insert_stmt = (
-            insert(Keyword)
-            .values(**values)
-            .on_conflict_do_update(
-                index_elements=["org_id", "video_id", "term"],
-                set_={
-                    "count": count,
-                    "last_updated_at": datetime.utcnow(),
-                },
-            )
+            last_updated_at=now,
         )
+        for term, count in freq
+    ]
 
-        await session.execute(insert_stmt)
-        upserted.append({"term": term, "count": count})
+    insert_stmt = insert(Keyword)
+    insert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=["org_id", "video_id", "term"],
+        set_={
+            "count": insert_stmt.excluded.count,
+            "last_updated_at": insert_stmt.excluded.last_updated_at,
+        },
+    )
+    await session.execute(insert_stmt, rows)
 
-    await session.commit()
-    return upserted
+    return [{"term": term, "count": count} for term, count in freq]
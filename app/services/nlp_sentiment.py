@@ -6,26 +6,47 @@ This service provides a thin wrapper around a HuggingFace
 sentiment-analysis pipeline. It is designed to:
 
 1. Lazy-load the model only once per Celery worker process.
+   - `transformers` (and torch) is imported on that first load,
+     not at module import.
    - On the first call, the pipeline is created and cached.
    - Subsequent calls reuse the same pipeline instance.
 
-2. Support batch inference using the BATCH_SIZE env var.
+2. Support batch inference using the BATCH_SIZE env var. Inputs are
+   ordered by length before inference so each pipeline batch pads to
+   similar sizes; results are returned in the caller's order.
 
 3. Return normalized results with label, score, and model_name.
 
+4. Optionally serve an int8-quantized ONNX export of the model
+   (settings.USE_ONNX_INT8). Quantization uses dynamic AVX512-VNNI
+   int8 kernels via `optimum[onnxruntime]`, an optional dependency that
+   is imported only when the switch is on. The export is cached under
+   settings.ONNX_MODEL_DIR so it only runs once per host; a file lock
+   and an atomic directory swap keep concurrent workers from reading a
+   half-written export. Predictions are tagged "<model>@onnx-int8"
+   (see `served_model_name`).
+
 Related modules:
     - app/tasks/analyze.py → calls `analyze_batch` inside Celery tasks.
     - app/api/routes/health.py → uses `is_model_loaded` for health checks.
     - app/core/config.py → provides `HF_MODEL_NAME` from environment.
 """
 
+import fcntl
 import os
+import shutil
+import tempfile
+from pathlib import Path
 from typing import Dict, List
 
-from transformers import pipeline
-
 from app.core.config import settings
 
+# transformers.pipeline, imported on first model load (pulls in torch)
+pipeline = None
+
+# Written last by the ONNX export; its presence marks a complete export
+_ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
 # Global variable to hold the loaded model instance
 _model = None
 
@@ -44,11 +65,19 @@ def _load_model():
     Returns:
         transformers.Pipeline: Sentiment-analysis pipeline instance.
     """
-    global _model, model_loaded
+    global _model, model_loaded, pipeline
 
     if _model is None:
+        if pipeline is None:
+            from transformers import pipeline as _pipeline
+
+            pipeline = _pipeline
+
         # Use the model name from env (HF_MODEL_NAME in .env)
-        _model = pipeline("sentiment-analysis", model=settings.HF_MODEL_NAME)
+        if settings.USE_ONNX_INT8:
+            _model = _load_onnx_int8_pipeline(settings.HF_MODEL_NAME)
+        else:
+            _model = pipeline("sentiment-analysis", model=settings.HF_MODEL_NAME)
 
         # Mark model as ready
         model_loaded = True
@@ -56,6 +85,92 @@ def _load_model():
     return _model
 
 
+def _load_onnx_int8_pipeline(model_name: str):
+    """
+    Build a sentiment pipeline backed by a dynamically int8-quantized
+    ONNX Runtime model, exporting + quantizing it on first use.
+
+    Prefork children warm up concurrently, so the export runs under an
+    exclusive file lock: one child exports, the others wait and then load
+    the finished files.
+
+    Args:
+        model_name (str): HuggingFace model identifier.
+
+    Returns:
+        transformers.Pipeline: Sentiment-analysis pipeline instance.
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    save_dir = Path(settings.ONNX_MODEL_DIR) / model_name.replace("/", "__")
+
+    save_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(f"{save_dir}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not (save_dir / _ONNX_QUANTIZED_FILE).exists():
+            _export_onnx_int8(model_name, save_dir)
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        save_dir, file_name=_ONNX_QUANTIZED_FILE, provider="CPUExecutionProvider"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(save_dir)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+
+def _export_onnx_int8(model_name: str, save_dir: Path):
+    """
+    Export + quantize `model_name` into a temp dir, then move it to
+    `save_dir`, so the directory only ever appears complete (the caller
+    holds the export lock).
+
+    Args:
+        model_name (str): HuggingFace model identifier.
+        save_dir (Path): Final location of the quantized model + tokenizer.
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from optimum.onnxruntime.quantization import ORTQuantizer
+    from transformers import AutoTokenizer
+
+    tmp_dir = tempfile.mkdtemp(dir=save_dir.parent, prefix=f".{save_dir.name}-")
+    try:
+        # Tokenizer before the quantized model, whose file marks completion
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(tmp_dir)
+        onnx_model = ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True
+        )
+        quantizer = ORTQuantizer.from_pretrained(onnx_model)
+        quantizer.quantize(
+            save_dir=tmp_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            ),
+        )
+
+        # Drop any partial export left by a crashed run, then swap in
+        shutil.rmtree(save_dir, ignore_errors=True)
+        os.replace(tmp_dir, save_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def served_model_name() -> str:
+    """
+    Identify the model serving predictions, including its backend.
+
+    int8-quantized scores differ from the fp32 model's, so the backend is
+    part of the name stored with each prediction and of the cache key.
+
+    Returns:
+        str: HF_MODEL_NAME, suffixed with "@onnx-int8" when
+        settings.USE_ONNX_INT8 is on.
+    """
+    if settings.USE_ONNX_INT8:
+        return f"{settings.HF_MODEL_NAME}@onnx-int8"
+    return settings.HF_MODEL_NAME
+
+
 def analyze_batch(texts: List[str]) -> List[Dict[str, str]]:
     """
     Run sentiment analysis on a batch of text strings.
@@ -68,15 +183,19 @@ def analyze_batch(texts: List[str]) -> List[Dict[str, str]]:
             Each dict contains:
             - label: "pos" | "neg" | "neu"
             - score: float confidence score
-            - model_name: str, model identifier
+            - model_name: str, model identifier (see `served_model_name`)
     """
     model = _load_model()
 
+    # Group similar lengths into the same pipeline batch to minimize padding
+    # (character length is a cheap proxy for token length)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
     # HuggingFace pipeline automatically handles batching if we pass a list
-    results = model(texts, batch_size=BATCH_SIZE, truncation=True)
+    results = model([texts[i] for i in order], batch_size=BATCH_SIZE, truncation=True)
 
-    normalized = []
-    for r in results:
+    normalized = [None] * len(texts)
+    for i, r in zip(order, results):
         # Normalize labels to lower-case short form
         label = r["label"].lower()
         if label.startswith("pos"):
@@ -86,13 +205,11 @@ def analyze_batch(texts: List[str]) -> List[Dict[str, str]]:
         else:
             label = "neu"
 
-        normalized.append(
-            {
-                "label": label,
-                "score": float(r["score"]),
-                "model_name": settings.HF_MODEL_NAME,
-            }
-        )
+        normalized[i] = {
+            "label": label,
+            "score": float(r["score"]),
+            "model_name": served_model_name(),
+        }
     return normalized
 
 
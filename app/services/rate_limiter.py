@@ -32,11 +32,52 @@ RATE_LIMIT_REFILL_RATE = 5 / 60  # tokens per second (~5 tokens per minute)
 # Global Redis connection pool
 redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
 
+# Bucket state TTL in seconds (expires after inactivity)
+RATE_LIMIT_BUCKET_TTL = 60
+
+# Token bucket evaluated atomically inside Redis (single round trip).
+# KEYS[1] = bucket key
+# ARGV    = now, max tokens, refill rate (tokens/sec), ttl
+# Returns 1 if a token was consumed, 0 if the request is rejected.
+_TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local max_tokens = tonumber(ARGV[2])
+local refill_rate = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or max_tokens
+local last_refill = tonumber(bucket[2]) or now
+
+tokens = math.min(max_tokens, tokens + (now - last_refill) * refill_rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_refill', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+return allowed
+"""
+
+# Clock fed to the script (wall time: bucket state is shared across
+# processes). Module-level so tests can advance it without sleeping.
+_now = time.time
+
+# Registered once; redis-py runs it via EVALSHA and reloads it on NOSCRIPT.
+_token_bucket = redis.register_script(_TOKEN_BUCKET_LUA)
+
 
 async def check_rate_limit(org_id: str) -> bool:
     """
     Check and update the rate limit bucket for a given org.
 
+    The refill, consume, and persist steps run as one Lua script, so
+    concurrent requests for the same org cannot interleave and each
+    check costs a single Redis round trip.
+
     Args:
         org_id (str): Tenant organization identifier.
 
@@ -45,36 +86,40 @@ async def check_rate_limit(org_id: str) -> bool:
         - True -> request allowed (token consumed).
         - False -> request denied (rate limit exceeded).
     """
+    allowed = await _token_bucket(
+        keys=[f"rate:{org_id}"], args=_bucket_args(), client=redis
+    )
+    return bool(allowed)
+
+
+async def check_rate_limit_many(org_id: str, n: int) -> list[bool]:
+    """
+    Run `n` consecutive rate limit checks for an org in one round trip.
+
+    The token-bucket script is queued `n` times on a non-transactional
+    pipeline; Redis still evaluates each call atomically and in order, so
+    the results match `n` sequential `check_rate_limit` calls.
+
+    Args:
+        org_id (str): Tenant organization identifier.
+        n (int): Number of requests (tokens) to check.
+
+    Returns:
+        list[bool]: One allowed/denied flag per check, in order.
+    """
     key = f"rate:{org_id}"
-    now = time.time()
-
-    # Fetch state
-    bucket = await redis.hgetall(key)
-    if bucket:
-        tokens = float(bucket.get("tokens", RATE_LIMIT_MAX_TOKENS))
-        last_refill = float(bucket.get("last_refill", now))
-    else:
-        tokens = RATE_LIMIT_MAX_TOKENS
-        last_refill = now
-
-    # Refill tokens based on elapsed time
-    elapsed = now - last_refill
-    tokens = min(RATE_LIMIT_MAX_TOKENS, tokens + elapsed * RATE_LIMIT_REFILL_RATE)
-    allowed = tokens >= 1.0
-
-    if allowed:
-        tokens -= 1.0  # consume one token
-        await redis.hset(
-            key,
-            mapping={"tokens": tokens, "last_refill": now},  # ✅ fixed
-        )
-        await redis.expire(key, 60)  # expire after inactivity
-        return True
-    else:
-        # No tokens -> reject request
-        await redis.hset(
-            key,
-            mapping={"tokens": tokens, "last_refill": now},
-        )
-        await redis.expire(key, 60)
-        return False
+    async with redis.pipeline(transaction=False) as pipe:
+        for _ in range(n):
+            await _token_bucket(keys=[key], args=_bucket_args(), client=pipe)
+        results = await pipe.execute()
+    return [bool(allowed) for allowed in results]
+
+
+def _bucket_args() -> list:
+    """Script ARGV: now, max tokens, refill rate (tokens/sec), ttl."""
+    return [
+        _now(),
+        RATE_LIMIT_MAX_TOKENS,
+        RATE_LIMIT_REFILL_RATE,
+        RATE_LIMIT_BUCKET_TTL,
+    ]
@@ -0,0 +1,97 @@
+"""
+File: sentiment_cache.py
+Service: Sentiment Prediction Cache
+-----------------------------------
+This service memoizes sentiment predictions in Redis so that identical
+comment texts ("First!", emoji-only replies, bot spam) are scored by the
+model only once.
+
+Key responsibilities:
+    - Key predictions by served model (name + backend, e.g. int8 ONNX)
+      + a short BLAKE2b digest of the text.
+    - Deduplicate texts within a batch before inference.
+    - Run `nlp_sentiment.analyze_batch` only on cache misses.
+    - Write fresh predictions back with a TTL (SENTIMENT_CACHE_TTL env).
+    - Degrade gracefully: Redis errors fall back to plain inference.
+
+Related modules:
+    - app/services/nlp_sentiment.py → runs the model on cache misses.
+    - app/tasks/analyze.py → calls `analyze_batch_cached` per chunk.
+    - app/core/config.py → provides `HF_MODEL_NAME` / `USE_ONNX_INT8`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.services import nlp_sentiment
+
+logger = logging.getLogger(__name__)
+
+# Cached predictions expire after 7 days by default
+SENTIMENT_CACHE_TTL = int(os.getenv("SENTIMENT_CACHE_TTL", 7 * 24 * 3600))
+
+
+def _cache_key(text: str) -> str:
+    """Build the Redis key for a text under the current model."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+    return f"sent:{nlp_sentiment.served_model_name()}:{digest}"
+
+
+async def analyze_batch_cached(
+    redis: aioredis.Redis, texts: List[str]
+) -> List[Dict[str, str]]:
+    """
+    Run sentiment analysis on texts, reusing cached predictions.
+
+    Args:
+        redis (aioredis.Redis): Async Redis client used as the cache.
+        texts (List[str]): Comment texts (duplicates allowed).
+
+    Returns:
+        List[Dict[str, str]]: One result per input text, in input order,
+        with the same shape as `nlp_sentiment.analyze_batch`.
+    """
+    unique = list(dict.fromkeys(texts))
+    keys = [_cache_key(t) for t in unique]
+
+    try:
+        cached = await redis.mget(keys)
+    except RedisError:
+        logger.warning("Sentiment cache read failed; scoring all texts", exc_info=True)
+        cached = [None] * len(unique)
+
+    predictions: Dict[str, Dict[str, str]] = {}
+    misses: List[str] = []
+    miss_keys: List[str] = []
+    for text, key, value in zip(unique, keys, cached):
+        if value is None:
+            misses.append(text)
+            miss_keys.append(key)
+        else:
+            predictions[text] = {
+                **json.loads(value),
+                "model_name": nlp_sentiment.served_model_name(),
+            }
+
+    if misses:
+        fresh = nlp_sentiment.analyze_batch(misses)
+        predictions.update(zip(misses, fresh))
+
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, result in zip(miss_keys, fresh):
+                    value = json.dumps(
+                        {"label": result["label"], "score": result["score"]}
+                    )
+                    pipe.set(key, value, ex=SENTIMENT_CACHE_TTL)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Sentiment cache write failed", exc_info=True)
+
+    return [predictions[t] for t in texts]
@@ -8,12 +8,14 @@ YouTube video metadata for a given organization (tenant).
 Key responsibilities:
     - Ensure each org/video pair is unique (org_id + yt_video_id).
     - Insert new videos or update existing ones with latest metadata.
-    - Guarantee the video row is committed so its UUID can be reused
-      as a foreign key for related tables (e.g., comments).
+    - Resolve an external YouTube video ID to the internal UUID.
+    - Return the persisted row so its UUID can be reused as a foreign key
+      for related tables (e.g., comments) within the caller's transaction.
 
 Related modules:
     - app/models/video.py → defines the Video table schema.
     - app/tasks/fetch.py → calls `upsert_video` during ingestion.
+    - app/tasks/aggregate.py → calls `get_video_pk` before aggregating.
 """
 
 import sqlalchemy as sa
@@ -47,8 +49,9 @@ async def upsert_video(
         - Uses Postgres `INSERT ... ON CONFLICT DO UPDATE`.
         - Conflict target: (org_id, yt_video_id).
         - Updates `title`, `channel_id`, and `last_analyzed_at` on conflict.
-        - Commits the transaction and re-fetches the full Video row
-          to return a fully populated ORM instance.
+        - Returns the full upserted row via `RETURNING` (single round trip),
+          refreshing any instance already in the session's identity map.
+        - Does not commit: the caller owns the transaction.
     """
     insert_stmt = insert(Video).values(
         org_id=org_id,
@@ -64,14 +67,28 @@ async def upsert_video(
             "channel_id": insert_stmt.excluded.channel_id,
             "last_analyzed_at": sa.func.now(),
         },
-    ).returning(Video.id)
+    )
+    stmt = stmt.returning(Video).execution_options(populate_existing=True)
 
     result = await db.execute(stmt)
-    video_pk = result.scalar_one()
+    return result.scalar_one()
 
-    # Commit
-    await db.commit()
 
-    # Load the full Video object so we can access video.id, title, etc.
-    result = await db.execute(select(Video).where(Video.id == video_pk))
-    return result.scalar_one()
+async def get_video_pk(db: AsyncSession, org_id: str, video_id: str) -> str | None:
+    """
+    Look up the internal UUID of a video for this org.
+
+    Args:
+        db (AsyncSession): Active SQLAlchemy async session.
+        org_id (str): Tenant organization ID for scoping.
+        video_id (str): External YouTube video ID.
+
+    Returns:
+        str | None: Video UUID, or None if the video was never ingested.
+    """
+    result = await db.execute(
+        select(Video.id)
+        .where(Video.org_id == org_id)
+        .where(Video.yt_video_id == video_id)
+    )
+    return result.scalar_one_or_none()
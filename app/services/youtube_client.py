@@ -17,7 +17,6 @@ Related modules:
     - app/services/dedupe.py → consumes comments for upsert.
 """
 
-import asyncio
 from datetime import datetime
 
 
@@ -62,12 +61,13 @@ async def fetch_comments(video_id: str, org_id: str, page_token: str = None):
             }
 
     Note:
-        - Simulates two pages of results with a short sleep.
+        - Simulates two pages of results; pages are yielded immediately.
         - Replace with real API pagination logic in production.
+        - Callers may consume this generator from a background task
+          (see app/tasks/fetch.py) so page I/O overlaps with DB writes.
     """
 
     for i in range(2):
-        await asyncio.sleep(0.05)
         yield [
             {
                 # include org_id for uniqueness in stub
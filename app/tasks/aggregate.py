@@ -8,7 +8,7 @@ frequencies.
 
 Key responsibilities:
     - Aggregate comment_sentiment rows into windowed trends
-      (daily, weekly, etc.).
+      (day, week, etc.).
     - Compute overall sentiment distribution for a video.
     - Extract top keywords from comments and persist them
       into the `keywords` table.
@@ -20,6 +20,9 @@ Related modules:
     - app/services/keywords.py → implements keyword extraction + persistence.
     - app/models/sentiment_aggregate.py → schema for aggregates.
     - app/models/keyword.py → schema for keywords.
+    - app/services/videos.py → resolves external video IDs to UUIDs.
+    - app/tasks/celery_app.py → `process_video_task` chains these after
+      fetch + analyze.
     - app/api/routes/analytics.py → exposes endpoints for clients.
 
 Entrypoints:
@@ -27,11 +30,9 @@ Entrypoints:
     - compute_keywords_task(video_id, org_id, top_k)
 """
 
-from asgiref.sync import async_to_sync
-
 from app.db.session import async_session
-from app.services import aggregates, keywords
-from app.tasks.celery_app import celery_app
+from app.services import aggregates, keywords, videos
+from app.tasks.celery_app import celery_app, resolve_video_id, run_async
 
 
 @celery_app.task(
@@ -41,16 +42,15 @@ from app.tasks.celery_app import celery_app
     max_retries=5,
     name="task.compute_sentiment_trend",
 )
-def compute_sentiment_trend_task(
-    self, video_id: str, org_id: str, window: str = "daily"
-):
+def compute_sentiment_trend_task(self, video_id: str, org_id: str, window: str = "day"):
     """
     Celery entrypoint: Compute and persist sentiment aggregates for a video.
 
     Args:
-        video_id (str): External YouTube video ID.
+        video_id (str | dict): External YouTube video ID, or the analyze
+            task's result dict when chained.
         org_id (str): Tenant org identifier.
-        window (str): Aggregation window (default "daily").
+        window (str): Postgres date_trunc unit (default "day").
 
     Returns:
         dict : {
@@ -59,7 +59,9 @@ def compute_sentiment_trend_task(
             "aggregates_computed": int
         }
     """
-    return async_to_sync(_compute_sentiment_trend)(video_id, org_id, window)
+    return run_async(
+        _compute_sentiment_trend(resolve_video_id(video_id), org_id, window)
+    )
 
 
 async def _compute_sentiment_trend(video_id: str, org_id: str, window: str):
@@ -67,6 +69,7 @@ async def _compute_sentiment_trend(video_id: str, org_id: str, window: str):
     Async worker logic to compute sentiment trend aggregates.
 
     Steps:
+        0. Resolve the external video ID to the internal UUID.
         1. Query comment_sentiment for org/video.
         2. Group by requested window (e.g., day).
         3. Insert or update sentiment_aggregates rows.
@@ -75,14 +78,18 @@ async def _compute_sentiment_trend(video_id: str, org_id: str, window: str):
     Returns:
         dict: Summary of how many aggregate rows were computed.
     """
-    async with async_session() as session:
-        aggregates_computed = await aggregates.compute_and_store_trend(
-            session, video_id, org_id, window
+    async with async_session() as session, session.begin():
+        video_pk = await videos.get_video_pk(session, org_id, video_id)
+        if video_pk is None:
+            return {"video_id": video_id, "window": window, "aggregates_computed": 0}
+
+        trend = await aggregates.compute_and_store_trend(
+            session, video_pk, org_id, window
         )
         return {
             "video_id": video_id,
             "window": window,
-            "aggregates_computed": aggregates_computed,
+            "aggregates_computed": len(trend),
         }
 
 
@@ -98,7 +105,8 @@ def compute_keywords_task(self, video_id: str, org_id: str, top_k: int = 25):
     Celery entrypoint: Compute and persist top keywords for a video.
 
     Args:
-        video_id (str): External YouTube video ID.
+        video_id (str | dict): External YouTube video ID, or the trend
+            task's result dict when chained.
         org_id (str): Tenant org identifier.
         top_k (int): Number of top keywords to store.
 
@@ -108,7 +116,7 @@ def compute_keywords_task(self, video_id: str, org_id: str, top_k: int = 25):
             "keywords_computed": int
         }
     """
-    return async_to_sync(_compute_keywords)(video_id, org_id, top_k)
+    return run_async(_compute_keywords(resolve_video_id(video_id), org_id, top_k))
 
 
 async def _compute_keywords(video_id: str, org_id: str, top_k: int):
@@ -116,16 +124,21 @@ async def _compute_keywords(video_id: str, org_id: str, top_k: int):
     Async worker logic to compute keyword frequencies.
 
     Steps:
-        1. Query all comments for org/video.
-        2. Tokenize text and count keyword frequencies.
+        0. Resolve the external video ID to the internal UUID.
+        1. Tokenize and count terms in SQL for org/video.
+        2. Fetch only the top_k (term, count) rows.
         3. Upsert top_k terms into keywords table.
         4. Commit transaction.
 
     Returns:
         dict: Summary of how many keywords were computed.
     """
-    async with async_session() as session:
+    async with async_session() as session, session.begin():
+        video_pk = await videos.get_video_pk(session, org_id, video_id)
+        if video_pk is None:
+            return {"video_id": video_id, "keywords_computed": 0}
+
         results = await keywords.compute_and_store_keywords(
-            session, video_id, org_id, top_k
+            session, video_pk, org_id, top_k
         )
         return {"video_id": video_id, "keywords_computed": len(results)}
@@ -8,10 +8,13 @@ to the `comment_sentiment` table.
 
 Key responsibilities:
     - Query only comments that do not yet have sentiment rows.
-    - Run batch inference using app/services/nlp_sentiment.py.
+    - Run batch inference using app/services/nlp_sentiment.py, skipping
+      texts already scored (Redis cache in app/services/sentiment_cache.py).
     - Insert results into comment_sentiment with org scoping.
     - Enforce idempotency via (org_id, comment_id) unique constraint.
     - Warm up model so /healthz can confirm model_loaded=true.
+    - Fan large backlogs out to parallel shard tasks (a chord summed by
+      `summarize_analysis_task`) so several workers share the inference.
 
 Related modules:
     - app/services/nlp_sentiment.py → wraps HuggingFace pipeline.
@@ -21,18 +24,40 @@ Related modules:
 
 Entrypoints:
     - analyze_comments_task(video_id, org_id) → Celery task wrapper.
+    - analyze_comments_shard_task(video_id, org_id, comment_ids) → one shard.
+    - summarize_analysis_task(results, video_id) → chord callback.
 """
 
+import os
 from datetime import datetime
 
-from asgiref.sync import async_to_sync
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+import redis.asyncio as aioredis
+from celery import group
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from app.core.config import settings
 from app.db.session import async_session
 from app.models import Comment, CommentSentiment, Video
-from app.services import nlp_sentiment
-from app.tasks.celery_app import celery_app
+from app.services import sentiment_cache
+from app.tasks.celery_app import celery_app, resolve_video_id, run_async
+
+# Comments sent to the model per inference call (bounds memory on large videos)
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", 32))
+
+# Shared async Redis client for the prediction cache, reused by every task
+# run. from_url does not connect; connections open lazily on the worker's
+# persistent event loop (see run_async), after fork.
+_CACHE = aioredis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
+# Backlogs larger than this are split into shards analyzed in parallel
+ANALYZE_SHARD_THRESHOLD = int(os.getenv("ANALYZE_SHARD_THRESHOLD", 5000))
+ANALYZE_SHARD_SIZE = int(os.getenv("ANALYZE_SHARD_SIZE", 2000))
 
 
 @celery_app.task(
@@ -46,9 +71,70 @@ def analyze_comments_task(self, video_id: str, org_id: str):
     """
     Celery entrypoint for sentiment analysis.
 
+    Args:
+        video_id (str | dict): YouTube video ID (external), or the
+            fetch task's result dict when chained.
+        org_id (str): Tenant org identifier.
+
+    Returns:
+        dict: {
+            "video_id": str,
+            "comments_analyzed": int
+        }
+
+    Note:
+        When more than ANALYZE_SHARD_THRESHOLD comments are pending, the
+        task replaces itself with a chord of shard tasks; the summed
+        result has the same shape.
+    """
+    video_id = resolve_video_id(video_id)
+
+    shards = run_async(_plan_shards(video_id, org_id))
+    if shards:
+        job = group(
+            analyze_comments_shard_task.s(video_id, org_id, comment_ids)
+            for comment_ids in shards
+        )
+        return self.replace(job | summarize_analysis_task.s(video_id))
+
+    return run_async(_analyze_comments(video_id, org_id))
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+    name="task.analyze_comments_shard",
+)
+def analyze_comments_shard_task(
+    self, video_id: str, org_id: str, comment_ids: list[str]
+):
+    """
+    Celery entrypoint: analyze one shard of a large backlog.
+
     Args:
         video_id (str): YouTube video ID (external).
         org_id (str): Tenant org identifier.
+        comment_ids (list[str]): Comment UUIDs in this shard.
+
+    Returns:
+        dict: {
+            "video_id": str,
+            "comments_analyzed": int
+        }
+    """
+    return run_async(_analyze_comments(video_id, org_id, comment_ids))
+
+
+@celery_app.task(name="task.summarize_analysis")
+def summarize_analysis_task(results: list[dict], video_id: str):
+    """
+    Chord callback: combine shard results into one analysis summary.
+
+    Args:
+        results (list[dict]): Return values of the shard tasks.
+        video_id (str): YouTube video ID (external).
 
     Returns:
         dict: {
@@ -56,73 +142,141 @@ def analyze_comments_task(self, video_id: str, org_id: str):
             "comments_analyzed": int
         }
     """
-    return async_to_sync(_analyze_comments)(video_id, org_id)
+    return {
+        "video_id": video_id,
+        "comments_analyzed": sum(r["comments_analyzed"] for r in results),
+    }
+
+
+def _unanalyzed_select(*columns):
+    """
+    SELECT `columns` for comments of an org/video that have no sentiment
+    row yet (LEFT JOIN ... IS NULL on the unique index).
+
+    Bind params: org_id, yt_vid.
+    """
+    return (
+        select(*columns)
+        .join(Video, Comment.video_id == Video.id)
+        .outerjoin(
+            CommentSentiment,
+            and_(
+                CommentSentiment.comment_id == Comment.id,
+                CommentSentiment.org_id == bindparam("org_id"),
+            ),
+        )
+        .where(Comment.org_id == bindparam("org_id"))
+        .where(Video.yt_video_id == bindparam("yt_vid"))  # ✅ filter by YouTube ID
+        .where(CommentSentiment.comment_id.is_(None))
+    )
+
+
+# Built once at import; each run only binds parameters (compiled-cache hit)
+_UNANALYZED_IDS_STMT = _unanalyzed_select(Comment.id)
+# Counts at most `probe_limit` pending rows, so deciding whether to shard
+# never scans (or loads) the whole backlog
+_PENDING_PROBE_STMT = select(func.count()).select_from(
+    _UNANALYZED_IDS_STMT.limit(bindparam("probe_limit")).subquery()
+)
+_UNANALYZED_STMT = _unanalyzed_select(Comment.id, Comment.text).execution_options(
+    yield_per=1000
+)
+_UNANALYZED_SHARD_STMT = _UNANALYZED_STMT.where(
+    Comment.id.in_(bindparam("comment_ids", expanding=True))
+)
+_INSERT_SENTIMENTS_STMT = (
+    pg_insert(CommentSentiment)
+    .on_conflict_do_nothing(index_elements=["org_id", "comment_id"])
+    .returning(CommentSentiment.comment_id)
+)
+
+
+async def _plan_shards(video_id: str, org_id: str) -> list[list[str]]:
+    """
+    Split the pending backlog into shards when it exceeds the threshold.
+
+    A bounded count probe decides first; comment ids are only loaded
+    once the backlog is known to need sharding.
+
+    Returns:
+        list[list[str]]: Comment ID shards, or [] to analyze in-process.
+    """
+    params = {"org_id": org_id, "yt_vid": video_id}
+    async with async_session() as session:
+        pending = await session.scalar(
+            _PENDING_PROBE_STMT, {**params, "probe_limit": ANALYZE_SHARD_THRESHOLD + 1}
+        )
+        if pending <= ANALYZE_SHARD_THRESHOLD:
+            return []
+
+        ids = (await session.scalars(_UNANALYZED_IDS_STMT, params)).all()
+
+    return [
+        ids[i : i + ANALYZE_SHARD_SIZE] for i in range(0, len(ids), ANALYZE_SHARD_SIZE)
+    ]
 
 
-async def _analyze_comments(video_id: str, org_id: str):
+async def _analyze_comments(
+    video_id: str, org_id: str, comment_ids: list[str] | None = None
+):
     """
     Async worker logic to analyze unanalyzed comments.
 
+    Args:
+        video_id (str): YouTube video ID (external).
+        org_id (str): Tenant org identifier.
+        comment_ids (list[str], optional): Restrict to these comments
+            (one shard); defaults to every pending comment of the video.
+
     Steps:
-        1. Select comments for this org/video that do not yet
+        1. Stream comments for this org/video that do not yet
            have sentiment entries.
-        2. Run texts through sentiment analysis in batch.
-        3. Insert new rows into comment_sentiment.
+        2. For each fixed-size chunk (SENTIMENT_BATCH_SIZE), run the texts
+           through sentiment analysis; duplicate and previously seen texts
+           are served from the prediction cache.
+        3. Bulk-insert the chunk's rows into comment_sentiment before the
+           next chunk is fetched (ON CONFLICT DO NOTHING keeps reruns
+           idempotent), so memory stays bounded by the chunk size.
         4. Commit transaction.
-        5. Mark worker model as warmed up.
 
     Returns:
         dict: Summary of how many comments were analyzed.
     """
+    params = {"org_id": org_id, "yt_vid": video_id}
+    if comment_ids is None:
+        stmt = _UNANALYZED_STMT
+    else:
+        stmt = _UNANALYZED_SHARD_STMT
+        params["comment_ids"] = comment_ids
+
+    now = datetime.utcnow()
+    inserted = 0
     async with async_session() as session:
-        # 1. Find comments linked to the external YouTube video_id
-        stmt = (
-            select(Comment)
-            .join(Video, Comment.video_id == Video.id)
-            .where(Comment.org_id == org_id)
-            .where(Video.yt_video_id == video_id)  # ✅ filter by YouTube ID
-            .where(
-                ~Comment.id.in_(
-                    select(CommentSentiment.comment_id).where(
-                        CommentSentiment.org_id == org_id
-                    )
-                )
+        # 1. Find comments linked to the external YouTube video_id that
+        #    have no sentiment row yet (anti-join on the unique index)
+        result = await session.stream(stmt, params)
+        async for chunk in result.partitions(SENTIMENT_BATCH_SIZE):
+            # 2. Run sentiment analysis on this chunk (cached by text hash)
+            sentiments = await sentiment_cache.analyze_batch_cached(
+                _CACHE, [text for _, text in chunk]
             )
-        )
-        result = await session.execute(stmt)
-        comments = result.scalars().all()
-
-        if not comments:
-            return {"video_id": video_id, "comments_analyzed": 0}
-
-        texts = [c.text for c in comments]
-
-        # 2. Run sentiment analysis in batch
-        sentiment_results = nlp_sentiment.analyze_batch(texts)
-
-        # 3. Persist results
-        inserted = 0
-        for comment, sent in zip(comments, sentiment_results):
-            try:
-                cs = CommentSentiment(
-                    org_id=org_id,
-                    comment_id=comment.id,
-                    label=sent["label"],
-                    score=sent["score"],
-                    model_name=sent["model_name"],
-                    analyzed_at=datetime.utcnow(),
-                )
-                session.add(cs)
-                inserted += 1
-            except IntegrityError:
-                # Skip if already exists (idempotency)
-                await session.rollback()
 
-        await session.commit()
+            # 3. Persist the chunk; conflicts are skipped server-side
+            rows = [
+                {
+                    "org_id": org_id,
+                    "comment_id": comment_id,
+                    "label": sent["label"],
+                    "score": sent["score"],
+                    "model_name": sent["model_name"],
+                    "analyzed_at": now,
+                }
+                for (comment_id, _), sent in zip(chunk, sentiments)
+            ]
+            inserted += len(
+                (await session.execute(_INSERT_SENTIMENTS_STMT, rows)).all()
+            )
 
-        # 4. Mark worker as warmed up (model loaded)
-        if nlp_sentiment.is_model_loaded():
-            # This will later surface in /healthz
-            pass
+        await session.commit()
 
-        return {"video_id": video_id, "comments_analyzed": inserted}
+    return {"video_id": video_id, "comments_analyzed": inserted}
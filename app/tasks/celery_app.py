@@ -8,30 +8,136 @@ background tasks (e.g., comment ingestion, sentiment analysis).
 Key responsibilities:
     - Define the central Celery `celery_app` object.
     - Configure broker and result backend from environment variables.
-    - Auto-discover tasks within `app/tasks/`.
+    - Serialize task messages and results with msgpack (zstd-compressed
+      results); task args/results must stay msgpack-clean (str/int/dict).
+    - Register the task modules in `app/tasks/` (explicit `include`).
+    - Run async task bodies on one persistent event loop per worker
+      process (`run_async`), so DB connection pools survive across tasks.
     - Provide simple health-check (`ping`) and warmup tasks.
+    - Warm the sentiment model in each worker process at startup.
+    - Provide `process_video_task`, which chains fetch → analyze →
+      trend → keywords so stages hand off inside the worker.
 
 Related modules:
     - app/tasks/fetch.py → fetch YouTube comments into DB.
     - app/tasks/analyze.py → analyze comments for sentiment.
+    - app/tasks/aggregate.py → compute sentiment trends + keywords.
     - app/services/nlp_sentiment.py → HuggingFace sentiment model.
     - app/api/routes/health.py → monitors worker + model readiness.
 """
 
+import asyncio
+import logging
 import os
+import threading
 
-from celery import Celery
+import redis
+from celery import Celery, chain
+from celery.signals import worker_process_init
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared sync Redis client for worker status flags (e.g. hf_model_loaded).
+# from_url does not connect; the pool is lazily filled and reset after fork.
+_REDIS = redis.Redis.from_url(
+    settings.REDIS_URL, socket_keepalive=True, health_check_interval=30
+)
 
 celery_app = Celery(
     "ytsa",
     broker=os.getenv("CELERY_BROKER_URL", "redis://redis:6379/1"),
     backend=os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/2"),
+    # Imported by the worker at startup so every task is registered
+    include=[
+        "app.tasks.fetch",
+        "app.tasks.analyze",
+        "app.tasks.aggregate",
+    ],
 )
 
-# Auto-discover tasks from app/tasks/
-celery_app.autodiscover_tasks(["app.tasks"])
+celery_app.conf.update(
+    task_serializer="msgpack",
+    result_serializer="msgpack",
+    accept_content=["msgpack"],
+    result_accept_content=["msgpack"],
+    result_compression="zstd",
+    # Ack after the task finishes so a crashed worker's task is redelivered;
+    # with late acks, reserve one task at a time so long analysis shards
+    # spread across workers instead of queueing behind each other
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    broker_pool_limit=50,
+    # Must exceed the longest task, or unacked tasks are redelivered
+    broker_transport_options={"visibility_timeout": 3600},
+    # Child processes load the model before reporting ready (see
+    # _warm_model_on_start); allow more than the 4s default for that.
+    worker_proc_alive_timeout=120,
+)
+
+# Per-process event loop shared by every async task body (see run_async)
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _start_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop and run it forever in a daemon thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=loop.run_forever, name="celery-asyncio-loop", daemon=True
+    ).start()
+    return loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**_):
+    """
+    Start a fresh loop in each forked worker process.
+
+    Threads do not survive fork(), so a loop inherited from the parent
+    would never run; every child gets its own.
+    """
+    global _loop
+    _loop = _start_loop()
+
 
-# Explicit imports ensure all tasks get registered
+def run_async(coro):
+    """
+    Run a coroutine on the worker's persistent event loop and wait for it.
+
+    Unlike `asyncio.run` / `async_to_sync`, the loop (and therefore the
+    async engine's pooled connections) is reused across tasks.
+
+    Args:
+        coro: Coroutine to execute.
+
+    Returns:
+        Any: The coroutine's result (exceptions are re-raised).
+    """
+    global _loop
+    if _loop is None:
+        # Lazily start for non-prefork pools (solo, threads) and eager mode
+        with _loop_lock:
+            if _loop is None:
+                _loop = _start_loop()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def resolve_video_id(value) -> str:
+    """
+    Accept either a YouTube video_id or the previous chain step's result.
+
+    Pipeline tasks receive the upstream task's return dict as their first
+    argument when run inside `process_video_task`'s chain.
+
+    Args:
+        value (str | dict): External video ID, or a dict with "video_id".
+
+    Returns:
+        str: External YouTube video ID.
+    """
+    return value["video_id"] if isinstance(value, dict) else value
 
 
 @celery_app.task(name="task.ping")
@@ -45,16 +151,48 @@ def ping():
     return "pong"
 
 
+def _warm_model() -> bool:
+    """
+    Load the HuggingFace model in this process and publish the Redis flag.
+
+    Returns:
+        bool: True if the pipeline is initialized.
+    """
+    from app.services import nlp_sentiment
+
+    # Run once with a dummy input to trigger lazy loading
+    nlp_sentiment.analyze_batch(["warmup"])
+
+    # Store shared flag in Redis
+    _REDIS.set("hf_model_loaded", "true")
+
+    return nlp_sentiment.is_model_loaded()
+
+
+@worker_process_init.connect
+def _warm_model_on_start(**_):
+    """
+    Warm the model in every worker process before it accepts tasks.
+
+    A failure is logged rather than raised so the worker still starts;
+    the first analysis task then loads the model lazily.
+    """
+    try:
+        _warm_model()
+    except Exception:
+        logger.exception("Model warmup at worker start failed")
+
+
 @celery_app.task(name="task.warmup_model")
 def warmup_model():
     """
     Celery task to force-load the HuggingFace sentiment model.
 
     Purpose:
-        - Ensures the model pipeline is initialized once after deploy.
+        - Workers already warm up at process start (worker_process_init);
+          this task is kept for compatibility and manual re-checks.
         - Allows /healthz to report:
             {"hf_model": {"status": "ok", "loaded": true}}
-        - Eliminates cold-start latency for the first real analysis task.
 
     Returns:
         dict: {
@@ -64,16 +202,38 @@ def warmup_model():
     Usage:
         >>> warmup_model.delay().get(timeout=30)
     """
-    import redis
+    return {"model_loaded": _warm_model()}
 
-    from app.core.config import settings
-    from app.services import nlp_sentiment
 
-    # Run once with a dummy input to trigger lazy loading
-    nlp_sentiment.analyze_batch(["warmup"])
+@celery_app.task(bind=True, name="task.process_video")
+def process_video_task(self, video_id: str, org_id: str):
+    """
+    Celery entrypoint: run the full ingestion + analytics pipeline for a video.
 
-    # Store shared flag in Redis
-    r = redis.Redis.from_url(settings.REDIS_URL)
-    r.set("hf_model_loaded", "true")
+    The task replaces itself with a chain, so each stage is dispatched by
+    the worker as soon as the previous one finishes (no client polling):
+
+        fetch_comments → analyze_comments → compute_sentiment_trend
+            → compute_keywords
+
+    Signatures are built by task name to avoid importing the task modules
+    (which import this module).
 
-    return {"model_loaded": nlp_sentiment.is_model_loaded()}
+    Args:
+        video_id (str): External YouTube video ID.
+        org_id (str): Tenant org identifier.
+
+    Returns:
+        dict: Result of the final stage (compute_keywords_task).
+    """
+    pipeline = chain(
+        celery_app.signature(
+            "task.fetch_comments",
+            args=(video_id, org_id),
+            kwargs={"enqueue_analysis": False},
+        ),
+        celery_app.signature("task.analyze_comments", args=(org_id,)),
+        celery_app.signature("task.compute_sentiment_trend", args=(org_id,)),
+        celery_app.signature("task.compute_keywords", args=(org_id,)),
+    )
+    return self.replace(pipeline)
@@ -8,8 +8,10 @@ the database. It runs asynchronously and is retried on transient errors.
 Key responsibilities:
     - Ensure the video exists in the `videos` table (insert or update).
     - Fetch comments from the YouTube client in paginated batches.
+    - Prefetch the next page in a background producer while the current
+      page is being upserted (bounded queue keeps memory flat).
     - Upsert comments into the `comments` table with deduplication.
-    - Commit the transaction once all inserts are done.
+    - Run the whole ingestion in one transaction, committed once at the end.
 
 Idempotency:
     - Guaranteed by unique constraint (org_id, yt_comment_id).
@@ -22,14 +24,18 @@ Related modules:
     - app/models/comment.py → comment schema definition.
 """
 
-from asgiref.sync import async_to_sync
+import asyncio
+import os
 
 from app.db.session import async_session
 from app.services.dedupe import upsert_comments
 from app.services.videos import upsert_video
 from app.services.youtube_client import fetch_comments, fetch_video_metadata
 from app.tasks.analyze import analyze_comments_task
-from app.tasks.celery_app import celery_app
+from app.tasks.celery_app import celery_app, run_async
+
+# Max comment pages buffered ahead of the DB writer
+FETCH_QUEUE_MAXSIZE = int(os.getenv("FETCH_PREFETCH_BATCHES", 4))
 
 
 @celery_app.task(
@@ -39,13 +45,18 @@ from app.tasks.celery_app import celery_app
     max_retries=5,
     name="task.fetch_comments",
 )
-def fetch_comments_task(self, video_id: str, org_id: str):
+def fetch_comments_task(
+    self, video_id: str, org_id: str, enqueue_analysis: bool = True
+):
     """
     Celery entrypoint: Fetch + persist comments for a given video/org.
 
     Args:
         video_id (str): External YouTube video ID.
         org_id (str): Tenant org identifier.
+        enqueue_analysis (bool): Enqueue analyze_comments_task when done.
+            False when running inside process_video_task's chain, which
+            schedules analysis itself.
 
     Returns:
         dict: {
@@ -53,43 +64,72 @@ def fetch_comments_task(self, video_id: str, org_id: str):
             "comments_fetched": int
         }
     """
-    return async_to_sync(_fetch_comments)(video_id, org_id)
+    return run_async(_fetch_comments(video_id, org_id, enqueue_analysis))
 
 
-async def _fetch_comments(video_id: str, org_id: str):
+async def _fetch_comments(video_id: str, org_id: str, enqueue_analysis: bool = True):
     """
     Async worker logic for fetching and persisting comments.
 
     Steps:
         1. Upsert video metadata into the `videos` table.
-        2. Iterate over comments from YouTube client (batched).
-        3. Normalize missing fields with defaults.
-        4. Upsert comments into the `comments` table.
-        5. Commit the transaction once all inserts are complete.
-        6. Trigger sentiment analysis on the ingested comments.
+        2. Iterate over comments from YouTube client (batched), with the
+           next page fetched concurrently while the current one is upserted.
+        3. Upsert comments into the `comments` table (missing fields
+           get defaults in `upsert_comments`).
+        4. Commit the transaction once all inserts are complete.
+        5. Trigger sentiment analysis on the ingested comments
+           (unless the caller chains it).
     """
-    async with async_session() as session:
+    async with async_session() as session, session.begin():
         # 1. Ensure the video exists and get its DB UUID
         meta = await fetch_video_metadata(video_id)
         video = await upsert_video(session, org_id, video_id, meta)
 
-        # 2. Fetch comments in batches + persist
+        # 2. Fetch comments in batches + persist. A single consumer drains
+        #    the queue: all writes share one session/transaction, and an
+        #    AsyncSession must not run statements concurrently.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=FETCH_QUEUE_MAXSIZE)
+        producer = asyncio.create_task(_produce_batches(queue, video_id, org_id))
+
         total = 0
-        async for batch in fetch_comments(video_id, org_id):
-            for c in batch:
-                c.setdefault("author", "Anonymous")
-                c.setdefault("published_at", "1970-01-01T00:00:00Z")
-                c.setdefault("like_count", 0)
-                c.setdefault("parent_id", None)
+        try:
+            while (batch := await queue.get()) is not None:
+                # 🔑 Pass DB UUID, not YouTube ID
+                await upsert_comments(session, org_id, video.id, batch)
+                total += len(batch)
+        except BaseException:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
 
-            # 🔑 Pass DB UUID, not YouTube ID
-            await upsert_comments(session, org_id, video.id, batch)
-            total += len(batch)
+        # Re-raise any error the producer hit mid-pagination
+        await producer
 
-        # 3. Commit all comment inserts at once
-        await session.commit()
+        # 3. Leaving session.begin() commits all inserts at once
 
     # 4. Enqueue sentiment analysis as a follow-up task
-    analyze_comments_task.delay(video_id, org_id)
+    if enqueue_analysis:
+        analyze_comments_task.delay(video_id, org_id)
 
     return {"video_id": video_id, "comments_fetched": total}
+
+
+async def _produce_batches(queue: asyncio.Queue, video_id: str, org_id: str):
+    """
+    Producer: pull comment pages from the YouTube client into `queue`.
+
+    A `None` sentinel is enqueued last so the consumer stops, even when the
+    client raises mid-pagination. It is not enqueued on cancellation: the
+    consumer only cancels once it has stopped draining, so waiting on a
+    full queue there would block forever.
+    """
+    try:
+        async for batch in fetch_comments(video_id, org_id):
+            await queue.put(batch)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        await queue.put(None)
+        raise
+    await queue.put(None)
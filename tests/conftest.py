@@ -2,66 +2,162 @@
 Shared pytest fixtures for integration + unit tests.
 
 Provides:
-    - async_client: httpx.AsyncClient bound to FastAPI app.
-    - auth_headers: provisions a fresh Org+User and returns a valid JWT.
+    - async_client: httpx.AsyncClient bound to FastAPI app (one per session,
+      after the test database is created/reset).
+    - auth_headers: provisions one Org+User per session and returns a valid JWT.
     - current_user: fake authenticated user bound to the test org.
     - seeded_comments_for_auth: seed one video + comments under JWT org_id.
     - seeded_sentiments_for_auth: extends seeded_comments_for_auth with sentiments.
-    - db_session: yields a fresh SQLAlchemy AsyncSession per test (truncated tables).
-    - redis_client: isolated Redis client per test.
+    - db_session: yields a fresh SQLAlchemy AsyncSession per test (tables
+      truncated once per session).
+    - redis_client: pooled Redis client per session, flushed before each test.
     - mock_celery: mock Celery tasks for ingestion/status flow.
 """
 
+import os
+
+# Test settings (test-mode password hashing, cheap bcrypt where it still
+# runs); must be set before app settings load
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("BCRYPT_COST", "4")
+# One fixed-size DB pool shared by the whole session (session-scoped loop)
+os.environ.setdefault("DB_POOL_SIZE", "10")
+os.environ.setdefault("DB_MAX_OVERFLOW", "0")
+
 import uuid
 import pytest
 import pytest_asyncio
 import redis.asyncio as aioredis
-import asyncio
 
 from httpx import ASGITransport, AsyncClient
 from datetime import datetime
-from sqlalchemy import select, text
+from sqlalchemy import String, case, cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
 
-from app.db.session import async_session
+# pytest-xdist: each worker gets its own database (created by _worker_db).
+# Must be applied before app.db.session builds the engine.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_BASE_DATABASE_URL = settings.DATABASE_URL
+if _XDIST_WORKER:
+    _url = make_url(_BASE_DATABASE_URL)
+    settings.DATABASE_URL = _url.set(
+        database=f"{_url.database}_{_XDIST_WORKER}"
+    ).render_as_string(hide_password=False)
+
+from app.db.base import Base
+from app.db.session import async_session, engine
 from app.main import app
 from app.models import Comment, CommentSentiment, Video
 from app.schemas.auth import CurrentUser
-from app.core.config import settings
 
 # ==============================================================================
-# Event Loop
+# Event Loop (one per session, managed by pytest-asyncio)
 # ==============================================================================
-@pytest.fixture(scope="session")
-def event_loop():
-    """Single event loop for all async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on the session-scoped event loop.
+
+    Session-scoped async fixtures (client, auth, seeds, Redis pool) already
+    use that loop via `asyncio_default_fixture_loop_scope = session`; tests
+    must share it so pooled DB/Redis connections stay on one loop.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 # ==============================================================================
-# Async HTTP Client
+# Async HTTP Client (one per test session)
 # ==============================================================================
-@pytest_asyncio.fixture
-async def async_client():
-    """httpx.AsyncClient bound to FastAPI app."""
+@pytest_asyncio.fixture(scope="session")
+async def async_client(_clean_db):
+    """
+    httpx.AsyncClient bound to FastAPI app, shared by all tests.
+
+    Depends on _clean_db so the (per-worker) database exists and is reset
+    before any request, even in modules that use no DB fixture directly.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
 # ==============================================================================
-# Authorization Header (fresh Org + User each test)
+# Per-Worker Database (pytest-xdist)
+# ==============================================================================
+@pytest_asyncio.fixture(scope="session")
+async def _worker_db():
+    """
+    Fixture: Under pytest-xdist, (re)create this worker's database and its
+    schema from the ORM models, and drop it when the session ends.
+    No-op for a single-process run (-n0).
+    """
+    if not _XDIST_WORKER:
+        yield
+        return
+
+    worker_db = make_url(settings.DATABASE_URL).database
+    admin = create_async_engine(_BASE_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{worker_db}"'))
+        await conn.execute(text(f'CREATE DATABASE "{worker_db}"'))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield
+
+    # Close the app's pooled connections to the worker DB, then drop it
+    await engine.dispose()
+    try:
+        async with admin.connect() as conn:
+            await conn.execute(
+                text(f'DROP DATABASE IF EXISTS "{worker_db}" WITH (FORCE)')
+            )
+    finally:
+        await admin.dispose()
+
+
+# ==============================================================================
+# Database Reset (once per test session)
+# ==============================================================================
+@pytest_asyncio.fixture(scope="session")
+async def _clean_db(_worker_db):
+    """
+    Fixture: Truncates relevant tables, including users/orgs, once per session.
+    Session-scoped seeds (auth_headers, seeded_*) are built on top of it.
+    """
+    async with async_session() as session:
+        for table in [
+            "sentiment_aggregates",
+            "comment_sentiment",
+            "comments",
+            "videos",
+            "users",
+            "orgs",
+        ]:
+            await session.execute(text(f"TRUNCATE {table} CASCADE"))
+        await session.commit()
+
+
+# ==============================================================================
+# Authorization Header (one Org + User per test session)
 # ==============================================================================
-@pytest_asyncio.fixture
-async def auth_headers(async_client, db_session):
+@pytest_asyncio.fixture(scope="session")
+async def auth_headers(async_client, _clean_db):
     """
-    Fixture: Provisions a fresh org+user via /auth/signup after DB reset,
-    logs in, and returns both the JWT header and org_id.
+    Fixture: Provisions an org+user via /auth/signup once per session and
+    returns both the JWT header and org_id. The signup token is used as-is
+    (login is covered by test_auth.py), so no extra login round-trip.
     """
     import base64, json, uuid
 
-    unique_suffix = str(uuid.uuid4())[:8]
+    unique_suffix = uuid.uuid4().hex[:8]
     email = f"user_{unique_suffix}@example.com"
     password = "secret123"
     org_name = f"Org_{unique_suffix}"
@@ -77,11 +173,6 @@ async def auth_headers(async_client, db_session):
     claims = json.loads(base64.urlsafe_b64decode(payload + "===").decode())
     org_id = claims["org_id"]
 
-    # Login
-    resp = await async_client.post("/auth/login", json={"email": email, "password": password})
-    assert resp.status_code == 200, f"Login failed: {resp.text}"
-    token = resp.json()["access_token"]
-
     return {
         "headers": {"Authorization": f"Bearer {token}"},
         "org_id": org_id,
@@ -91,11 +182,11 @@ async def auth_headers(async_client, db_session):
 # ==============================================================================
 # Current User (synthetic, for unit tests)
 # ==============================================================================
-@pytest.fixture
+@pytest.fixture(scope="session")
 def current_user(auth_headers):
     """Fake authenticated user for unit tests."""
     return CurrentUser(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4().hex,
         email="test@example.com",
         org_id=auth_headers["org_id"],
         role="admin",
@@ -103,114 +194,129 @@ def current_user(auth_headers):
 
 
 # ==============================================================================
-# Seeded Comments (Video + Comments under JWT org_id)
+# Seeded Comments (Video + Comments under JWT org_id, once per session)
 # ==============================================================================
-@pytest_asyncio.fixture
-async def seeded_comments_for_auth(db_session, auth_headers):
+@pytest_asyncio.fixture(scope="session")
+async def seeded_comments_for_auth(auth_headers):
     """Seed one video + comments tied to the JWT org_id."""
     org_id = auth_headers["org_id"]
 
-    video = Video(
-        id=str(uuid.uuid4()),
-        org_id=org_id,
-        yt_video_id="abc123",
-        title="Test Video",
-        channel_id="test_channel",
-        fetched_at=datetime.utcnow(),
-    )
-    db_session.add(video)
-    await db_session.flush()
-
-    comments = [
-        Comment(
-            id=str(uuid.uuid4()),
-            org_id=org_id,
-            video_id=video.id,
-            yt_comment_id="c1",
-            author="user1",
-            text="I love this video!",
-            published_at=datetime.utcnow(),
-            like_count=5,
-        ),
-        Comment(
-            id=str(uuid.uuid4()),
-            org_id=org_id,
-            video_id=video.id,
-            yt_comment_id="c2",
-            author="user2",
-            text="This is terrible",
-            published_at=datetime.utcnow(),
-            like_count=2,
-        ),
-    ]
-    db_session.add_all(comments)
-    await db_session.commit()
+    now = datetime.utcnow()
+
+    # One statement per table: video, then both comments as one executemany
+    async with async_session() as session:
+        video = (
+            await session.scalars(
+                pg_insert(Video)
+                .values(
+                    id=uuid.uuid4().hex,
+                    org_id=org_id,
+                    yt_video_id="abc123",
+                    title="Test Video",
+                    channel_id="test_channel",
+                    fetched_at=now,
+                )
+                .returning(Video)
+            )
+        ).one()
+
+        await session.execute(
+            pg_insert(Comment).on_conflict_do_nothing(constraint="uq_org_comment"),
+            [
+                dict(
+                    id=uuid.uuid4().hex,
+                    org_id=org_id,
+                    video_id=video.id,
+                    yt_comment_id="c1",
+                    author="user1",
+                    text="I love this video!",
+                    published_at=now,
+                    like_count=5,
+                ),
+                dict(
+                    id=uuid.uuid4().hex,
+                    org_id=org_id,
+                    video_id=video.id,
+                    yt_comment_id="c2",
+                    author="user2",
+                    text="This is terrible",
+                    published_at=now,
+                    like_count=2,
+                ),
+            ],
+        )
+        await session.commit()
     return video
 
 
 # ==============================================================================
-# Seeded Sentiments (extends Seeded Comments)
+# Seeded Sentiments (extends Seeded Comments, once per session)
 # ==============================================================================
-@pytest_asyncio.fixture
-async def seeded_sentiments_for_auth(seeded_comments_for_auth, db_session, auth_headers):
+@pytest_asyncio.fixture(scope="session")
+async def seeded_sentiments_for_auth(seeded_comments_for_auth, auth_headers):
     """Attach sentiments to seeded comments under JWT org_id."""
     org_id = auth_headers["org_id"]
+    now = datetime.utcnow()
+
+    # One INSERT ... SELECT: no id round-trip before writing the sentiments
+    label = case({"c1": "pos", "c2": "neg"}, value=Comment.yt_comment_id)
+    score = case({"c1": 0.95, "c2": 0.90}, value=Comment.yt_comment_id)
+    rows = select(
+        cast(func.gen_random_uuid(), String),
+        literal(org_id),
+        Comment.id,
+        label,
+        score,
+        literal("test-model"),
+        literal(now),
+    ).where(Comment.video_id == seeded_comments_for_auth.id, label.is_not(None))
 
-    comments = (
-        await db_session.execute(
-            select(Comment).where(Comment.video_id == seeded_comments_for_auth.id)
-        )
-    ).scalars().all()
-
-    for comment, (label, score) in zip(comments, [("pos", 0.95), ("neg", 0.90)]):
-        sentiment = CommentSentiment(
-            id=str(uuid.uuid4()),
-            org_id=org_id,
-            comment_id=comment.id,
-            label=label,
-            score=score,
-            model_name="test-model",
-            analyzed_at=datetime.utcnow(),
+    async with async_session() as session:
+        await session.execute(
+            pg_insert(CommentSentiment)
+            .from_select(
+                [
+                    "id",
+                    "org_id",
+                    "comment_id",
+                    "label",
+                    "score",
+                    "model_name",
+                    "analyzed_at",
+                ],
+                rows,
+            )
+            .on_conflict_do_nothing(index_elements=["org_id", "comment_id"])
         )
-        db_session.add(sentiment)
-
-    await db_session.commit()
+        await session.commit()
     return seeded_comments_for_auth
 
 
 # ==============================================================================
-# Database Session (truncate between tests, keep orgs)
+# Database Session (tables truncated once per session by _clean_db)
 # ==============================================================================
 @pytest_asyncio.fixture(scope="function")
-async def db_session():
+async def db_session(_clean_db):
     """
     Fixture: Yields a fresh database session for each test.
-    Ensures clean slate by truncating relevant tables, including users/orgs.
+    Tables are truncated once per session (see _clean_db), not per test,
+    so session-scoped seeds stay valid.
     """
     async with async_session() as session:
-        for table in [
-            "sentiment_aggregates",
-            "comment_sentiment",
-            "comments",
-            "videos",
-            "users",
-            "orgs",
-        ]:
-            await session.execute(text(f"TRUNCATE {table} CASCADE"))
-        await session.commit()
         yield session
 
 
 # ==============================================================================
-# Redis Client
+# Redis Client (one pooled client per session)
 # ==============================================================================
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def redis_client():
-    """Isolated Redis client per test."""
-    client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    await client.flushdb()
+    """Pooled Redis client shared by all tests (flushed per test below)."""
+    client = aioredis.from_url(
+        settings.REDIS_URL, decode_responses=True, max_connections=16
+    )
     yield client
-    await client.close()
+    await client.aclose()
 
 
 # ==============================================================================
@@ -218,101 +324,8 @@ async def redis_client():
 # ==============================================================================
 @pytest_asyncio.fixture(autouse=True)
 async def _patch_rate_limiter_redis(redis_client):
-    """Patch rate_limiter to use test Redis client."""
+    """Start each test with an empty Redis and point rate_limiter at it."""
     from app.services import rate_limiter
+    await redis_client.flushdb()
     rate_limiter.redis = redis_client
     yield
-
-
-"""
-File: security.py
-Purpose:
-    Provides security utilities for authentication and authorization.
-
-Key responsibilities:
-    - Password hashing and verification with bcrypt.
-    - JWT access token creation and decoding.
-    - Centralized cryptographic logic used across the app.
-
-Related modules:
-    - passlib.context.CryptContext → password hashing (bcrypt).
-    - jwt (PyJWT) → encode/decode JWT tokens.
-    - app.core.config → provides JWT secret, algorithm, and expiry settings.
-"""
-
-from datetime import datetime, timedelta
-
-import jwt
-from passlib.context import CryptContext
-
-from app.core.config import settings
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def hash_password(password: str) -> str:
-    """
-    Hash a plaintext password using bcrypt.
-
-    Args:
-        password (str): Plaintext password.
-
-    Returns:
-        str: Securely hashed password.
-    """
-    return pwd_context.hash(password)
-
-
-def verify_password(plain: str, hashed: str) -> bool:
-    """
-    Verify a plaintext password against its hashed version.
-
-    Args:
-        plain (str): Plaintext password.
-        hashed (str): Hashed password from DB.
-
-    Returns:
-        bool: True if the password matches, False otherwise.
-    """
-    return pwd_context.verify(plain, hashed)
-
-
-def create_access_token(data: dict, expires_minutes: int = None) -> str:
-    """
-    Create a signed JWT access token.
-
-    Args:
-        data (dict): Claims to encode in the token (e.g., user_id, org_id, role).
-        expires_minutes (int, optional): Expiry in minutes. Defaults to settings.JWT_EXP_MINUTES.
-
-    Returns:
-        str: Encoded JWT token string.
-    """
-
-    to_encode = data.copy()
-
-    # Use default only if expires_minutes is not provided
-    if expires_minutes is None:
-        expires_minutes = settings.JWT_EXP_MINUTES
-
-    expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
-    to_encode.update({"exp": expire})
-    return jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
-
-
-def decode_token(token: str) -> dict:
-    """
-    Decode and validate a JWT access token.
-
-    Args:
-        token (str): Encoded JWT token string.
-
-    Returns:
-        dict: Decoded payload containing claims.
-    """
-    return jwt.decode(
-        token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-    )
-
@@ -20,16 +20,14 @@ Purpose:
 import uuid
 import jwt
 import pytest
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient
 
-from app.main import create_app
 from app.tasks.fetch import _fetch_comments
-from app.core.config import settings
 
 
 @pytest.mark.asyncio
 @pytest.mark.e2e
-async def test_smoke_signup_login_ingest():
+async def test_smoke_signup_login_ingest(async_client: AsyncClient):
     """
     E2E smoke test:
         - Sign up a new org/user (unique per run)
@@ -38,60 +36,58 @@ async def test_smoke_signup_login_ingest():
         - Run _fetch_comments manually to simulate worker
         - Fetch analytics distribution for that video
     """
-    app = create_app()
+    client = async_client
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        # 1. Signup with unique org/user
-        unique = uuid.uuid4().hex[:6]
-        signup_payload = {
-            "org_name": f"E2EOrg_{unique}",
-            "email": f"e2e_{unique}@example.com",
-            "password": "password123",
-        }
-        resp = await client.post("/auth/signup", json=signup_payload)
-        assert resp.status_code == 200, resp.text
-        token = resp.json()["access_token"]
+    # 1. Signup with unique org/user
+    unique = uuid.uuid4().hex[:6]
+    signup_payload = {
+        "org_name": f"E2EOrg_{unique}",
+        "email": f"e2e_{unique}@example.com",
+        "password": "password123",
+    }
+    resp = await client.post("/auth/signup", json=signup_payload)
+    assert resp.status_code == 200, resp.text
+    token = resp.json()["access_token"]
 
-        # 2. Login
-        resp = await client.post(
-            "/auth/login",
-            json={
-                "email": signup_payload["email"],
-                "password": signup_payload["password"],
-            },
-        )
-        assert resp.status_code == 200, resp.text
-        token = resp.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+    # 2. Login
+    resp = await client.post(
+        "/auth/login",
+        json={
+            "email": signup_payload["email"],
+            "password": signup_payload["password"],
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    token = resp.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
-        # 3. Ingest a video (enqueue Celery task)
-        resp = await client.post(
-            "/ingest/",
-            params={"video_id": "abc123"},
-            headers=headers,
-        )
-        assert resp.status_code == 200, resp.text
-        task_id = resp.json()["task_id"]
-        assert task_id
+    # 3. Ingest a video (enqueue Celery task)
+    resp = await client.post(
+        "/ingest/",
+        params={"video_id": "abc123"},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    task_id = resp.json()["task_id"]
+    assert task_id
 
-        # 3b. Simulate Celery worker execution (invoke real ingestion coroutine)
-        claims = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        org_id = claims["org_id"]
-        await _fetch_comments("abc123", org_id)
+    # 3b. Simulate Celery worker execution (invoke real ingestion coroutine).
+    #     The token was just issued by the app, so only read its claims.
+    claims = jwt.decode(token, options={"verify_signature": False})
+    org_id = claims["org_id"]
+    await _fetch_comments("abc123", org_id)
 
-        # 4. Fetch analytics distribution
-        resp = await client.get(
-            "/analytics/distribution",
-            params={"video_id": "abc123"},
-            headers=headers,
-        )
-        assert resp.status_code == 200, resp.text
+    # 4. Fetch analytics distribution
+    resp = await client.get(
+        "/analytics/distribution",
+        params={"video_id": "abc123"},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
 
-        # 5. Validate response shape
-        data = resp.json()
-        assert "pos_pct" in data
-        assert "neg_pct" in data
-        assert "neu_pct" in data
-        assert "count" in data
+    # 5. Validate response shape
+    data = resp.json()
+    assert "pos_pct" in data
+    assert "neg_pct" in data
+    assert "neu_pct" in data
+    assert "count" in data
@@ -19,6 +19,7 @@ Related tests:
 import uuid
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
@@ -45,10 +46,14 @@ async def test_sentiment_trend_correctness(
     db_session.add(video)
     await db_session.flush()
 
-    # Seed comments + sentiments
-    for yt_cid, label in [("c1", "pos"), ("c2", "neg"), ("c3", "neu")]:
+    # Seed comments + sentiments (yt ids distinct from the session seeds c1/c2)
+    for yt_cid, label in [
+        ("trend-c1", "pos"),
+        ("trend-c2", "neg"),
+        ("trend-c3", "neu"),
+    ]:
         comment = Comment(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             org_id=org_id,
             video_id=video.id,
             yt_comment_id=yt_cid,
@@ -61,7 +66,7 @@ async def test_sentiment_trend_correctness(
         await db_session.flush()
 
         sentiment = CommentSentiment(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             org_id=org_id,
             comment_id=comment.id,
             label=label,
@@ -100,12 +105,17 @@ async def test_sentiment_trend_wrong_org_isolation(
     """
     Ensure querying another org’s video returns 404 (multi-tenancy isolation).
     """
-    # Create a separate org + seed a video under it
-    other_org = Org(id=str(uuid.uuid4()), name="Other Org")
-    db_session.add(other_org)
-    await db_session.flush()
+    # Get-or-create a separate org in one statement + seed a video under it
+    other_org_id = (
+        await db_session.execute(
+            pg_insert(Org)
+            .values(id=uuid.uuid4().hex, name="Other Org")
+            .on_conflict_do_update(index_elements=["name"], set_={"name": "Other Org"})
+            .returning(Org.id)
+        )
+    ).scalar_one()
 
-    video = Video(org_id=other_org.id, yt_video_id="yt-other", title="Other Org Video")
+    video = Video(org_id=other_org_id, yt_video_id="yt-other", title="Other Org Video")
     db_session.add(video)
     await db_session.commit()
 
@@ -0,0 +1,51 @@
+"""
+Unit-test fixtures layered over tests/conftest.py.
+
+Provides:
+    - redis_client: in-process fakeredis (Lua-enabled) instead of a real
+      Redis server; still flushed before each test by the root autouse
+      fixture, which also binds it into rate_limiter.
+    - db_session: AsyncSession inside an outer transaction that is rolled
+      back after each test (test commits only release a SAVEPOINT), so unit
+      tests never leave rows behind and skip per-test cleanup.
+"""
+
+import fakeredis.aioredis
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+
+
+# ==============================================================================
+# Redis Client (in-process fake, one per session)
+# ==============================================================================
+@pytest_asyncio.fixture(scope="session")
+async def redis_client():
+    """In-process Redis (supports EVALSHA for the token-bucket script)."""
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+# ==============================================================================
+# Database Session (rolled back per test)
+# ==============================================================================
+@pytest_asyncio.fixture(scope="function")
+async def db_session(_clean_db):
+    """
+    Fixture: Yields a session bound to one connection-level transaction.
+
+    Unit tests only read back what they wrote through this same session, so
+    nothing needs to be visible to other connections; the outer rollback
+    discards everything. Integration tests keep the committing db_session.
+    """
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await outer.rollback()
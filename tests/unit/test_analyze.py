@@ -0,0 +1,142 @@
+"""
+Unit Test: Analyze Comments Task (Sharding)
+-------------------------------------------
+These tests verify how `app/tasks/analyze.py` splits large backlogs into
+shards and sums the shard results.
+
+Scope:
+    - `_plan_shards()` returns [] at or below ANALYZE_SHARD_THRESHOLD and
+      ANALYZE_SHARD_SIZE-sized shards covering every pending comment above it.
+    - Shard runs of `_analyze_comments()` sum to the whole backlog.
+    - `analyze_comments_task` replaces itself with a shard chord whose
+      callback (`summarize_analysis_task`) sums `comments_analyzed`.
+
+Notes:
+    - The model is never loaded: sentiment scoring is replaced with a fake.
+    - The task-flow test runs Celery eagerly with the DB helpers faked and
+      an in-memory result backend.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from celery.backends.cache import CacheBackend
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.session import async_session
+from app.models import Comment, Video
+from app.services import sentiment_cache
+from app.tasks import analyze
+from app.tasks.celery_app import celery_app
+
+PENDING_COMMENTS = 5
+
+
+@pytest_asyncio.fixture(scope="module")
+async def pending_video(auth_headers):
+    """Commit one video with PENDING_COMMENTS comments and no sentiments."""
+    org_id = auth_headers["org_id"]
+    now = datetime.utcnow()
+
+    async with async_session() as session:
+        video = (
+            await session.scalars(
+                pg_insert(Video)
+                .values(
+                    id=uuid.uuid4().hex,
+                    org_id=org_id,
+                    yt_video_id=f"shard-{uuid.uuid4().hex[:8]}",
+                    title="Shard Video",
+                    channel_id="test_channel",
+                    fetched_at=now,
+                )
+                .returning(Video)
+            )
+        ).one()
+        await session.execute(
+            pg_insert(Comment),
+            [
+                dict(
+                    id=uuid.uuid4().hex,
+                    org_id=org_id,
+                    video_id=video.id,
+                    yt_comment_id=f"{video.yt_video_id}-c{i}",
+                    author="user",
+                    text=f"comment {i}",
+                    published_at=now,
+                    like_count=0,
+                )
+                for i in range(PENDING_COMMENTS)
+            ],
+        )
+        await session.commit()
+    return video
+
+
+@pytest.mark.asyncio
+async def test_shards_cover_backlog_and_sum(pending_video, monkeypatch):
+    """
+    Verify a backlog above the threshold is split into shards whose
+    analyzed counts add up to every pending comment.
+    """
+
+    async def fake_analyze_batch_cached(redis, texts):
+        return [{"label": "pos", "score": 0.9, "model_name": "m"} for _ in texts]
+
+    monkeypatch.setattr(
+        sentiment_cache, "analyze_batch_cached", fake_analyze_batch_cached
+    )
+    video_id, org_id = pending_video.yt_video_id, pending_video.org_id
+
+    # At the threshold: analyzed in-process
+    monkeypatch.setattr(analyze, "ANALYZE_SHARD_THRESHOLD", PENDING_COMMENTS)
+    assert await analyze._plan_shards(video_id, org_id) == []
+
+    # Above it: shards of ANALYZE_SHARD_SIZE covering every pending comment
+    monkeypatch.setattr(analyze, "ANALYZE_SHARD_THRESHOLD", 2)
+    monkeypatch.setattr(analyze, "ANALYZE_SHARD_SIZE", 2)
+    shards = await analyze._plan_shards(video_id, org_id)
+    assert [len(s) for s in shards] == [2, 2, 1]
+    assert len({cid for s in shards for cid in s}) == PENDING_COMMENTS
+
+    results = [
+        await analyze._analyze_comments(video_id, org_id, comment_ids)
+        for comment_ids in shards
+    ]
+    summary = analyze.summarize_analysis_task(results, video_id)
+    assert summary == {"video_id": video_id, "comments_analyzed": PENDING_COMMENTS}
+
+    # Everything is analyzed now, so nothing is left to shard
+    assert await analyze._plan_shards(video_id, org_id) == []
+
+
+def test_analyze_task_replaces_itself_with_shard_chord(monkeypatch):
+    """
+    Verify `analyze_comments_task` fans shards out and returns the
+    chord callback's summed result (run eagerly, no broker).
+    """
+    shards = [["a", "b"], ["c", "d"], ["e"]]
+
+    async def fake_plan_shards(video_id, org_id):
+        return shards
+
+    async def fake_analyze_comments(video_id, org_id, comment_ids=None):
+        assert comment_ids is not None, "sharded runs must pass their ids"
+        return {"video_id": video_id, "comments_analyzed": len(comment_ids)}
+
+    monkeypatch.setattr(analyze, "_plan_shards", fake_plan_shards)
+    monkeypatch.setattr(analyze, "_analyze_comments", fake_analyze_comments)
+    # Freezing a chord registers its results with the (Redis) result
+    # backend; an in-memory backend keeps the eager run server-free
+    monkeypatch.setattr(
+        celery_app._local,
+        "backend",
+        CacheBackend(app=celery_app, url="memory://"),
+        raising=False,
+    )
+
+    result = analyze.analyze_comments_task.apply(args=("vid", "org")).get()
+
+    assert result == {"video_id": "vid", "comments_analyzed": 5}
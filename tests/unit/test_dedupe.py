@@ -8,6 +8,7 @@ Key responsibilities tested:
     - Ensure that when a comment with the same (org_id, yt_comment_id) is inserted again,
       the record is updated rather than duplicated.
     - Confirm that Postgres `ON CONFLICT (org_id, yt_comment_id)` works as intended.
+    - Ensure omitted fields get defaults and non-column keys are ignored.
 
 Fixtures used:
     - db_session: async SQLAlchemy session bound to the test database.
@@ -15,19 +16,36 @@ Fixtures used:
 """
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from datetime import datetime
 
 from app.services import dedupe
 from app.models.comment import Comment
 
+# Frozen timestamp for deterministic rows (naive: published_at is a naive
+# DateTime column, which asyncpg rejects tz-aware values for).
+FIXED_NOW = datetime(2024, 1, 1)
+
+# Built once; each lookup only binds parameters.
+# Selects plain columns (Core rows, not ORM instances), so the result never
+# goes through the session's identity map and always reflects the row the
+# UPSERT just wrote.
+_GET_COMMENT_STMT = select(Comment.author, Comment.text, Comment.like_count).where(
+    Comment.org_id == bindparam("org_id"),
+    Comment.video_id == bindparam("video_id"),
+    Comment.yt_comment_id == bindparam("yt_comment_id"),
+)
+
 
 @pytest.mark.asyncio
-async def test_upsert_comments_inserts_and_updates(db_session, seeded_comments_for_auth):
+async def test_upsert_comments_inserts_and_updates(
+    db_session, seeded_comments_for_auth
+):
     video = seeded_comments_for_auth
     org_id = video.org_id
     video_id = video.id
     yt_comment_id = "abc123"
+    params = {"org_id": org_id, "video_id": video_id, "yt_comment_id": yt_comment_id}
 
     # First insert
     comments = [
@@ -35,25 +53,18 @@ async def test_upsert_comments_inserts_and_updates(db_session, seeded_comments_f
             "yt_comment_id": yt_comment_id,
             "author": "user1",
             "text": "Great video!",
-            "published_at": datetime.utcnow(),
+            "published_at": FIXED_NOW,
             "like_count": 10,
         }
     ]
     await dedupe.upsert_comments(db_session, org_id, video_id, comments)
 
-    row = (
-        await db_session.execute(
-            select(Comment).where(
-                Comment.org_id == org_id,
-                Comment.video_id == video_id,
-                Comment.yt_comment_id == yt_comment_id,
-            )
-            .execution_options(populate_existing=True)
-        )
-    ).scalar_one()
-    assert row.author == "user1"
-    assert row.text == "Great video!"
-    assert row.like_count == 10
+    author, text, like_count = (
+        await db_session.execute(_GET_COMMENT_STMT, params)
+    ).one()
+    assert author == "user1"
+    assert text == "Great video!"
+    assert like_count == 10
 
     # Second insert with same yt_comment_id but updated fields
     updated_comments = [
@@ -61,30 +72,51 @@ async def test_upsert_comments_inserts_and_updates(db_session, seeded_comments_f
             "yt_comment_id": yt_comment_id,
             "author": "user2",
             "text": "Updated comment text",
-            "published_at": datetime.utcnow(),
+            "published_at": FIXED_NOW,
             "like_count": 42,
         }
     ]
     await dedupe.upsert_comments(db_session, org_id, video_id, updated_comments)
 
-    row = (
-        await db_session.execute(
-            select(Comment).where(
-                Comment.org_id == org_id,
-                Comment.video_id == video_id,
-                Comment.yt_comment_id == yt_comment_id,
-            )
-            # ⚠️ Important:
-            # SQLAlchemy caches ORM objects inside the session (identity map).
-            # Without this option, `scalar_one()` may return a stale in-memory row
-            # even after an UPSERT. `populate_existing=True` forces the ORM to
-            # overwrite any cached instance with the fresh data returned by the DB.
-            # This ensures our test assertions reflect the real persisted state.
-            .execution_options(populate_existing=True)
-        )
-    ).scalar_one()
+    author, text, like_count = (
+        await db_session.execute(_GET_COMMENT_STMT, params)
+    ).one()
 
     # Assert: record updated in place
-    assert row.author == "user2"
-    assert row.text == "Updated comment text"
-    assert row.like_count == 42
+    assert author == "user2"
+    assert text == "Updated comment text"
+    assert like_count == 42
+
+
+@pytest.mark.asyncio
+async def test_upsert_comments_fills_defaults_and_ignores_extra_keys(
+    db_session, seeded_comments_for_auth
+):
+    video = seeded_comments_for_auth
+    params = {
+        "org_id": video.org_id,
+        "video_id": video.id,
+        "yt_comment_id": "minimal-1",
+    }
+
+    # One full and one minimal comment in the same batch (executemany needs
+    # identical keys per row); "reply_count" is not a Comment column
+    comments = [
+        {
+            "yt_comment_id": "full-1",
+            "author": "user1",
+            "text": "Full comment",
+            "published_at": FIXED_NOW,
+            "like_count": 3,
+            "parent_id": None,
+        },
+        {"yt_comment_id": "minimal-1", "text": "Minimal comment", "reply_count": 2},
+    ]
+    await dedupe.upsert_comments(db_session, video.org_id, video.id, comments)
+
+    author, text, like_count = (
+        await db_session.execute(_GET_COMMENT_STMT, params)
+    ).one()
+    assert author == "Anonymous"
+    assert text == "Minimal comment"
+    assert like_count == 0
@@ -0,0 +1,72 @@
+"""
+Unit Test: Fetch Comments Task
+------------------------------
+These tests verify the producer/consumer pipeline in `app/tasks/fetch.py`.
+
+Scope:
+    - A failing `upsert_comments` call surfaces its error even while the
+      page producer is blocked on a full queue (no deadlock).
+
+Notes:
+    - The DB session, YouTube client and upsert services are replaced with
+      in-memory fakes; no database or API calls are involved.
+"""
+
+import asyncio
+
+import pytest
+
+from app.tasks import fetch
+
+
+class _FakeSession:
+    """Stands in for `async with async_session() as s, s.begin():`."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+
+@pytest.mark.asyncio
+async def test_upsert_failure_with_full_queue_raises(monkeypatch):
+    """
+    Verify an upsert error propagates (instead of hanging) when the
+    producer is parked on `queue.put` because the queue is full.
+    """
+    yielded = 0
+
+    async def fake_fetch_comments(video_id, org_id):
+        nonlocal yielded
+        for i in range(10):
+            yielded += 1
+            yield [{"yt_comment_id": f"c{i}", "text": "hi"}]
+
+    async def failing_upsert(session, org_id, video_id, batch):
+        # Let the producer fill the queue and block on the next put
+        while yielded < 3:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        raise RuntimeError("upsert failed")
+
+    async def fake_upsert_video(session, org_id, video_id, meta):
+        return type("Video", (), {"id": "video-uuid"})()
+
+    async def fake_metadata(video_id):
+        return {}
+
+    monkeypatch.setattr(fetch, "FETCH_QUEUE_MAXSIZE", 1)
+    monkeypatch.setattr(fetch, "async_session", _FakeSession)
+    monkeypatch.setattr(fetch, "fetch_video_metadata", fake_metadata)
+    monkeypatch.setattr(fetch, "upsert_video", fake_upsert_video)
+    monkeypatch.setattr(fetch, "fetch_comments", fake_fetch_comments)
+    monkeypatch.setattr(fetch, "upsert_comments", failing_upsert)
+
+    with pytest.raises(RuntimeError, match="upsert failed"):
+        await asyncio.wait_for(
+            fetch._fetch_comments("vid", "org", enqueue_analysis=False), timeout=2
+        )
@@ -1,7 +1,7 @@
 """
 Unit Test: Health Check Endpoint
 --------------------------------
-This test verifies that the `/healthz` endpoint is available and returns
+This test verifies that the `/health/healthz` endpoint is available and returns
 an HTTP 200 response in a minimal application context.
 
 Scope:
@@ -11,20 +11,16 @@ Scope:
 """
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from app.main import app
+from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
-async def test_healthz():
+async def test_healthz(async_client: AsyncClient):
     """
-    Verify `/healthz` endpoint returns a 200 OK response
+    Verify `/health/healthz` endpoint returns a 200 OK response
     with at least {"status": "ok"}.
     """
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        resp = await ac.get("/healthz")
+    resp = await async_client.get("/health/healthz")
     data = resp.json()
 
     # Core assertions
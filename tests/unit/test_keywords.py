@@ -14,67 +14,73 @@ Key aspects validated:
 """
 
 
-import pytest
+import pytest_asyncio
 from sqlalchemy import select
 
+from app.db.session import async_session
 from app.services import keywords
 from app.models.keyword import Keyword
 
 
-@pytest.mark.asyncio
-async def test_compute_and_store_keywords_extracts_and_persists(
-    db_session, seeded_comments_for_auth
-):
+@pytest_asyncio.fixture(scope="module")
+async def keyword_results(seeded_comments_for_auth):
+    """
+    Run keyword extraction once for the module on the seeded comments.
+
+    Returns the service result plus the Keyword rows it wrote, read back in
+    the same transaction, which is then rolled back (nothing persists).
+    """
+    video = seeded_comments_for_auth
+
+    async with async_session() as session:
+        results = await keywords.compute_and_store_keywords(
+            session,
+            video_id=video.id,
+            org_id=video.org_id,
+            top_k=5,
+        )
+        # Plain (term, count) rows: they stay readable after the rollback
+        rows = (
+            await session.execute(
+                select(Keyword.term, Keyword.count).where(
+                    Keyword.org_id == video.org_id, Keyword.video_id == video.id
+                )
+            )
+        ).all()
+        await session.rollback()
+
+    return {"results": results, "rows": rows}
+
+
+def test_compute_and_store_keywords_extracts_and_persists(keyword_results):
     """
     It should extract keywords from comments
     persist them into a `keywords` table,
     and return a structured list of {term, count}.
     """
-    video = seeded_comments_for_auth
-    org_id = video.org_id
-
-    # --- Act ---
-    results = await keywords.compute_and_store_keywords(
-        db_session,
-        video_id=video.id,
-        org_id=org_id,
-        top_k=5,
-    )
+    results = keyword_results["results"]
 
     # --- Assert: return shape ---
     assert isinstance(results, list)
     assert all("term" in r and "count" in r for r in results)
 
     # --- Assert: persisted in DB ---
-    rows = (await db_session.execute(select(Keyword))).scalars().all()
+    rows = keyword_results["rows"]
     assert len(rows) > 0
     assert all(row.term and row.count >= 1 for row in rows)
 
 
-
-@pytest.mark.asyncio
-async def test_compute_and_store_keywords_returns_expected_shape(
-    db_session, seeded_comments_for_auth
-):
+def test_compute_and_store_keywords_returns_expected_shape(keyword_results):
     """
     It should return a list of keyword dicts with
     the expected shape ({term, count}) when called
     on seeded comments.
     """
-    video = seeded_comments_for_auth
-    org_id = video.org_id
-
-    # --- Act ---
-    results = await keywords.compute_and_store_keywords(
-        db_session,
-        video_id=video.id,
-        org_id=org_id,
-        top_k=5,
-    )
+    results = keyword_results["results"]
 
     # --- Assert ---
     assert isinstance(results, list)
     if results:
         first = results[0]
         assert "term" in first
-        assert "count" in first
\ No newline at end of file
+        assert "count" in first
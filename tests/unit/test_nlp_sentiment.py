@@ -7,40 +7,61 @@ These tests verify the behavior of the sentiment analysis wrapper in
 Scope:
     - `_load_model()` initializes HuggingFace pipeline only once.
     - `analyze_batch()` normalizes results with label, score, model_name.
+    - `analyze_batch()` returns results in input order after length sorting.
     - `is_model_loaded()` reflects model warmup status.
 
 Notes:
-    - HuggingFace pipeline is patched with a fake implementation.
+    - HuggingFace pipeline is patched once per module with a fake factory;
+      each test starts from an unloaded model, and the original globals
+      are restored when the module finishes.
     - No external models are downloaded; results are deterministic.
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import app.services.nlp_sentiment as nlp
 
 
-async def test_load_model_initializes_once(monkeypatch):
+@pytest.fixture(scope="module", autouse=True)
+def _preserve_nlp_globals():
+    """Restore whatever model the module found, so later tests never reload it."""
+    prev = (nlp._model, nlp.model_loaded)
+    yield
+    nlp._model, nlp.model_loaded = prev
+
+
+@pytest.fixture(scope="module")
+def fake_pipeline():
+    """Install one fake HuggingFace `pipeline` factory for the module."""
+    factory = MagicMock(return_value=object())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(nlp, "pipeline", factory)
+        yield factory
+
+
+@pytest.fixture(autouse=True)
+def _unloaded_model(fake_pipeline):
+    """Reset the model globals and call history before each test."""
+    fake_pipeline.reset_mock()
+    nlp._model = None
+    nlp.model_loaded = False
+
+
+def test_load_model_initializes_once(fake_pipeline):
     """
     Verify `_load_model()` initializes the pipeline only once
     and reuses the same instance on subsequent calls.
     """
-    fake_pipeline = object()
-
-    with patch("app.services.nlp_sentiment.pipeline", return_value=fake_pipeline) as mock_pipeline:
-        # Reset globals before test
-        nlp._model = None
-        nlp.model_loaded = False
-
-        model1 = nlp._load_model()
-        model2 = nlp._load_model()
+    model1 = nlp._load_model()
+    model2 = nlp._load_model()
 
-        # Should return the fake pipeline both times
-        assert model1 is fake_pipeline
-        assert model2 is fake_pipeline
+    # Should return the fake pipeline both times
+    assert model1 is fake_pipeline.return_value
+    assert model2 is fake_pipeline.return_value
 
-        # Underlying HuggingFace pipeline called only once
-        mock_pipeline.assert_called_once()
+    # Underlying HuggingFace pipeline called only once
+    fake_pipeline.assert_called_once()
 
 
 def test_analyze_batch_normalizes_labels(monkeypatch):
@@ -75,19 +96,38 @@ def test_analyze_batch_normalizes_labels(monkeypatch):
         assert isinstance(out["score"], float)
 
 
-def test_is_model_loaded_flag(monkeypatch):
+def test_analyze_batch_preserves_input_order(monkeypatch):
     """
-    Verify `is_model_loaded()` correctly reflects warmup status.
+    Verify `analyze_batch()` returns results in input order even though
+    texts are length-sorted before being sent to the pipeline.
     """
-    # Reset state
-    nlp._model = None
-    nlp.model_loaded = False
+    seen = []
 
-    assert nlp.is_model_loaded() is False
+    def fake_pipeline(texts, batch_size=None, truncation=True):
+        seen.extend(texts)
+        return [
+            {"label": "POSITIVE" if len(t) > 3 else "NEGATIVE", "score": len(t)}
+            for t in texts
+        ]
+
+    monkeypatch.setattr(nlp, "_load_model", lambda: fake_pipeline)
+
+    outputs = nlp.analyze_batch(["looooong", "ok", "medium", "no"])
+
+    # Pipeline saw texts shortest-first
+    assert [len(t) for t in seen] == sorted(len(t) for t in seen)
 
-    # Patch pipeline so _load_model succeeds
-    monkeypatch.setattr(nlp, "pipeline", lambda *a, **k: object())
+    # Results map back to the caller's order
+    assert [o["score"] for o in outputs] == [8.0, 2.0, 6.0, 2.0]
+    assert [o["label"] for o in outputs] == ["pos", "neg", "pos", "neg"]
+
+
+def test_is_model_loaded_flag():
+    """
+    Verify `is_model_loaded()` correctly reflects warmup status.
+    """
+    assert nlp.is_model_loaded() is False
 
-    # Call _load_model to set flag
+    # Call _load_model (fake pipeline) to set flag
     nlp._load_model()
     assert nlp.is_model_loaded() is True
\ No newline at end of file
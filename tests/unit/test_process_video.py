@@ -0,0 +1,61 @@
+"""
+Unit Test: Process Video Pipeline Task
+--------------------------------------
+These tests verify `process_video_task` in `app/tasks/celery_app.py`.
+
+Scope:
+    - The task replaces itself with the fetch → analyze → trend → keywords
+      chain and returns the last stage's result.
+    - Each stage receives the external video_id, resolved from the previous
+      stage's result dict via `resolve_video_id`.
+
+Notes:
+    - Celery runs eagerly (`.apply()`, no broker); every stage body is
+      replaced with a fake that records its arguments.
+"""
+
+from app.tasks import aggregate, analyze, fetch
+from app.tasks.celery_app import process_video_task
+
+
+def test_process_video_chains_stages_with_resolved_video_id(monkeypatch):
+    """
+    Verify the eager chain runs all four stages in order, passing the
+    YouTube video_id (not the upstream dict) to each.
+    """
+    calls = []
+
+    async def fake_fetch(video_id, org_id, enqueue_analysis=True):
+        calls.append(("fetch", video_id, org_id, enqueue_analysis))
+        return {"video_id": video_id, "comments_fetched": 2}
+
+    async def fake_plan_shards(video_id, org_id):
+        return []
+
+    async def fake_analyze(video_id, org_id, comment_ids=None):
+        calls.append(("analyze", video_id, org_id))
+        return {"video_id": video_id, "comments_analyzed": 2}
+
+    async def fake_trend(video_id, org_id, window):
+        calls.append(("trend", video_id, org_id, window))
+        return {"video_id": video_id, "window": window, "aggregates_computed": 1}
+
+    async def fake_keywords(video_id, org_id, top_k):
+        calls.append(("keywords", video_id, org_id, top_k))
+        return {"video_id": video_id, "keywords": []}
+
+    monkeypatch.setattr(fetch, "_fetch_comments", fake_fetch)
+    monkeypatch.setattr(analyze, "_plan_shards", fake_plan_shards)
+    monkeypatch.setattr(analyze, "_analyze_comments", fake_analyze)
+    monkeypatch.setattr(aggregate, "_compute_sentiment_trend", fake_trend)
+    monkeypatch.setattr(aggregate, "_compute_keywords", fake_keywords)
+
+    result = process_video_task.apply(args=("vid", "org")).get()
+
+    assert calls == [
+        ("fetch", "vid", "org", False),
+        ("analyze", "vid", "org"),
+        ("trend", "vid", "org", "day"),
+        ("keywords", "vid", "org", 25),
+    ]
+    assert result == {"video_id": "vid", "keywords": []}
@@ -6,14 +6,15 @@ Unit tests for the Rate Limiter service.
 
 Targets:
     - check_rate_limit
+    - check_rate_limit_many
 
 Key aspects validated:
     - Token consumption per request.
     - Blocking when tokens are exhausted.
-    - Automatic token refill after wait time.
+    - Automatic token refill after wait time (clock advanced, no sleep).
 """
 
-import asyncio
+import time
 import pytest
 
 from app.services import rate_limiter
@@ -27,31 +28,35 @@ async def test_rate_limiter_allows_then_blocks(redis_client, seeded_comments_for
     """
     org_id = seeded_comments_for_auth.org_id
 
-    # Consume all tokens
-    allowed = [await rate_limiter.check_rate_limit(org_id) for _ in range(rate_limiter.RATE_LIMIT_MAX_TOKENS)]
+    # Consume all tokens plus one more, in a single pipelined round trip
+    *allowed, blocked = await rate_limiter.check_rate_limit_many(
+        org_id, rate_limiter.RATE_LIMIT_MAX_TOKENS + 1
+    )
     assert all(allowed) # all initial requests allowed
 
     # Next request should be blocked
-    blocked = await rate_limiter.check_rate_limit(org_id)
     assert blocked is False
+    assert await rate_limiter.check_rate_limit(org_id) is False
 
 
 @pytest.mark.asyncio
-async def test_rate_limiter_refills_token(redis_client, seeded_comments_for_auth):
+async def test_rate_limiter_refills_token(
+    redis_client, seeded_comments_for_auth, monkeypatch
+):
     """
     It should refill tokens after enough time has passed.
     """
     org_id = seeded_comments_for_auth.org_id
 
     # Exhaust bucket
-    for _ in range(rate_limiter.RATE_LIMIT_MAX_TOKENS):
-        await rate_limiter.check_rate_limit(org_id)
+    await rate_limiter.check_rate_limit_many(org_id, rate_limiter.RATE_LIMIT_MAX_TOKENS)
 
     # Blocked at this point
     assert await rate_limiter.check_rate_limit(org_id) is False
 
-    # Wait long enough for at leastg 1 token to refill
-    await asyncio.sleep(15) # 0.25 of a minute = 1 token with default config
+    # Advance the limiter's clock far enough for at least 1 token to refill
+    later = time.time() + 15  # 0.25 of a minute = 1 token with default config
+    monkeypatch.setattr(rate_limiter, "_now", lambda: later)
 
     allowed = await rate_limiter.check_rate_limit(org_id)
     assert allowed is True
\ No newline at end of file
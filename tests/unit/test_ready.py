@@ -1,32 +1,47 @@
 """
 Unit Test: Readiness Check Endpoint
 -----------------------------------
-This test verifies that the `/readyz` endpoint is available and returns
+This test verifies that the `/health/readyz` endpoint is available and returns
 an HTTP 200 response with dependency health information.
 
 Scope:
     - Confirms endpoint responds without errors.
     - Ensures top-level "status" field exists.
     - Validates presence of dependency check keys (db, redis, celery, hf_model).
-    - Does not require actual dependencies to be healthy:
-        accepts "ok", "error", or "not_loaded".
+    - Does not require actual dependencies: the DB/Redis/Celery/model
+      checks are stubbed once per module, since only the response shape
+      is asserted here.
 """
 
+from unittest.mock import AsyncMock
+
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
+
+from app.api.routes import health
+
 
-from app.main import app
+@pytest.fixture(scope="module", autouse=True)
+def _stub_dependency_checks():
+    """Replace the readiness checks so no DB, Redis, or broker is contacted."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("_check_db", "_check_redis", "_check_celery"):
+            mp.setattr(health, name, AsyncMock(return_value={"status": "ok"}))
+        mp.setattr(
+            health,
+            "_check_hf_model",
+            AsyncMock(return_value={"status": "ok", "loaded": True}),
+        )
+        yield
 
 
 @pytest.mark.asyncio
-async def test_readyz_endpoint():
+async def test_readyz_endpoint(async_client: AsyncClient):
     """
-    Verify `/readyz` endpoint returns a 200 OK response
+    Verify `/health/readyz` endpoint returns a 200 OK response
     and includes all expected dependency checks.
     """
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        resp = await ac.get("/readyz")
+    resp = await async_client.get("/health/readyz")
     data = resp.json()
 
     # Core assertions
@@ -10,25 +10,26 @@ Targets:
     - decode_token
 
 Key aspects validated:
-    - Password hashing and verification roundtrip.
+    - Password hashing and verification roundtrip (bcrypt and test mode).
     - JWT token creation with expiry claim.
     - Decoding returns expected payload.
+    - Fast-path HS256 tokens are byte-identical to PyJWT's.
     - Expired tokens raise exceptions.
 """
 
 
 import pytest
-import time
 import jwt
 
 from app.core import security
 from app.core.config import settings
 
 
-def test_password_hash_and_verify_roundtrip():
+def test_password_hash_and_verify_roundtrip(monkeypatch):
     """
     It should hash a password and successfully verify at.
     """
+    monkeypatch.setattr(settings, "ENV", "dev")  # exercise real bcrypt
     raw_password = "supersecret123"
     hashed = security.hash_password(raw_password)
 
@@ -37,6 +38,24 @@ def test_password_hash_and_verify_roundtrip():
     assert security.verify_password("wrongpassword", hashed) is False
 
 
+def test_test_mode_password_roundtrip(monkeypatch):
+    """
+    Under ENV=test it should skip bcrypt, and the plain values
+    must not verify outside test mode.
+    """
+    monkeypatch.setattr(settings, "ENV", "test")
+    hashed = security.hash_password("supersecret123")
+
+    assert not hashed.startswith("$2")  # no bcrypt hash
+    assert security.verify_password("supersecret123", hashed) is True
+    assert security.verify_password("wrongpassword", hashed) is False
+
+    # Outside test mode they (and any malformed hash) are simply rejected
+    monkeypatch.setattr(settings, "ENV", "prod")
+    assert security.verify_password("supersecret123", hashed) is False
+    assert security.verify_password("supersecret123", "not-a-hash") is False
+
+
 def test_create_and_decode_access_token():
     """
     It should create a JWT with claims and decode it back correctly.
@@ -51,13 +70,25 @@ def test_create_and_decode_access_token():
     assert "exp" in decoded
 
 
+def test_hs256_token_matches_pyjwt():
+    """
+    It should produce exactly the token PyJWT would for the same claims.
+    """
+    payload = {"sub": "user123", "org_id": "org456", "role": "admin"}
+    token = security.create_access_token(payload, expires_minutes=5)
+
+    claims = jwt.decode(token, options={"verify_signature": False})
+    expected = jwt.encode(claims, settings.JWT_SECRET_KEY, algorithm="HS256")
+    assert token == expected
+
+
 def test_expired_token_raises():
     """
     It should raise when decoding an expired JWT.
     """
     payload = {"sub": "user123", "org_id": "org456", "role": "admin"}
-    token = security.create_access_token(payload, expires_minutes=0)
+    # exp already one minute in the past: no need to sleep past expiry
+    token = security.create_access_token(payload, expires_minutes=-1)
 
-    time.sleep(1)  # ensure token is expired
     with pytest.raises(jwt.ExpiredSignatureError):
         security.decode_token(token)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+File: test_sentiment_cache.py
+Layer: Unit
+------------
+Unit tests for the Sentiment Prediction Cache service.
+
+Targets:
+    - analyze_batch_cached
+
+Key aspects validated:
+    - Duplicate texts in a batch are scored once.
+    - Texts already cached are not sent to the model again.
+    - Results come back in input order with the analyze_batch shape.
+    - fp32 and int8 ONNX predictions are cached (and tagged) separately.
+"""
+
+import pytest
+
+from app.core.config import settings
+from app.services import nlp_sentiment, sentiment_cache
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_cached_skips_duplicates_and_hits(
+    redis_client, monkeypatch
+):
+    """
+    It should run the model only on unseen, distinct texts
+    and serve everything else from Redis.
+    """
+    scored = []
+
+    def fake_analyze_batch(texts):
+        scored.append(list(texts))
+        return [
+            {"label": "pos" if "love" in t else "neg", "score": 0.9, "model_name": "m"}
+            for t in texts
+        ]
+
+    monkeypatch.setattr(nlp_sentiment, "analyze_batch", fake_analyze_batch)
+
+    # --- First call: duplicates collapse to a single inference each ---
+    first = await sentiment_cache.analyze_batch_cached(
+        redis_client, ["love it", "meh", "love it"]
+    )
+    assert [r["label"] for r in first] == ["pos", "neg", "pos"]
+    assert scored == [["love it", "meh"]]
+
+    # --- Second call: only the new text reaches the model ---
+    second = await sentiment_cache.analyze_batch_cached(
+        redis_client, ["meh", "love this", "love it"]
+    )
+    assert [r["label"] for r in second] == ["neg", "pos", "pos"]
+    assert scored[-1] == ["love this"]
+    assert all({"label", "score", "model_name"} <= r.keys() for r in second)
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_cached_separates_int8_backend(redis_client, monkeypatch):
+    """
+    It should not serve fp32 predictions to the int8 ONNX backend (or the
+    reverse), and should tag cached hits with the serving backend.
+    """
+    scored = []
+
+    def fake_analyze_batch(texts):
+        scored.append(list(texts))
+        return [
+            {
+                "label": "pos",
+                "score": 0.9,
+                "model_name": nlp_sentiment.served_model_name(),
+            }
+            for t in texts
+        ]
+
+    monkeypatch.setattr(nlp_sentiment, "analyze_batch", fake_analyze_batch)
+
+    monkeypatch.setattr(settings, "USE_ONNX_INT8", False)
+    await sentiment_cache.analyze_batch_cached(redis_client, ["love it"])
+
+    # --- Switching backend misses the fp32 entry ---
+    monkeypatch.setattr(settings, "USE_ONNX_INT8", True)
+    await sentiment_cache.analyze_batch_cached(redis_client, ["love it"])
+    assert scored == [["love it"], ["love it"]]
+
+    # --- A hit under int8 carries the int8 model name ---
+    (hit,) = await sentiment_cache.analyze_batch_cached(redis_client, ["love it"])
+    assert len(scored) == 2
+    assert hit["model_name"] == f"{settings.HF_MODEL_NAME}@onnx-int8"
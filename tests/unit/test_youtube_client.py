@@ -51,9 +51,7 @@ async def test_fetch_comments_yields_two_batches():
     org_id = "test_org"
 
     # Collect all comment batches
-    batches = []
-    async for batch in youtube_client.fetch_comments(video_id, org_id):
-        batches.append(batch)
+    batches = [b async for b in youtube_client.fetch_comments(video_id, org_id)]
 
     # Should yield exactly two batches
     assert len(batches) == 2
@@ -71,5 +69,5 @@ async def test_fetch_comments_yields_two_batches():
             assert "like_count" in comment
             assert "parent_id" in comment
 
-        total_comments = sum(len(batch) for batch in batches)
-        assert total_comments == 2
+    total_comments = sum(len(batch) for batch in batches)
+    assert total_comments == 2